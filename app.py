@@ -7,30 +7,39 @@ assemblit run app.py
 
 import streamlit as st
 
-routes = {
-    '': [
-        st.Page(page='site/welcome.py', title='Home', url_path='home', default=True),
-    ],
-    'Documentation': [
-        st.Page(page='site/documentation/getting_started.py', title='Getting started', url_path='documentation/getting-started'),
-        # st.Page(page='site/documentation/getting_started.py', title='Develop', url_path='documentation/develop'),
-        # st.Page(page='site/documentation/getting_started.py', title='    AaaS', url_path='documentation/develop/aaas'),
-        # st.Page(page='site/documentation/getting_started.py', title='    Wiki', url_path='documentation/develop/wiki'),
-        # st.Page(page='site/documentation/getting_started.py', title='Deploy', url_path='documentation/deploy'),
-        # st.Page(page='site/documentation/getting_started.py', title='    Docker', url_path='documentation/deploy/docker')
-    ],
-    'CLI reference': [
-        st.Page(page='site/cli_reference/1_assemblit.py', title='assemblit', url_path='lib/assemblit/app/cli'),
-        st.Page(page='site/cli_reference/2_orchestrator.py', title='orchestrator', url_path='lib/assemblit/orchestrator/cli')
-    ],
-    'API reference': [
-        st.Page(page='site/api_reference/1_assemblit.py', title='assemblit', url_path='lib/assemblit'),
-        st.Page(page='site/api_reference/1a_setup.py', title='    setup', url_path='lib/assemblit/setup'),
-        st.Page(page='site/api_reference/1b_blocks.py', title='    blocks', url_path='lib/assemblit/blocks'),
-        st.Page(page='site/api_reference/1c_pages.py', title='    pages', url_path='lib/assemblit/pages'),
-        st.Page(page='site/api_reference/1d_toolkit.py', title='    toolkit', url_path='lib/assemblit/toolkit')
-    ]
-}
-
-page = st.navigation(pages=routes, position='sidebar')
+# Define the url-path prefix of the library reference pages
+_PREFIX = 'lib/assemblit'
+
+# Define the navigation routes as (section, page, title, url-path, default) specifications
+_PAGE_SPECS = (
+    ('', 'site/welcome.py', 'Home', 'home', True),
+    ('Documentation', 'site/documentation/getting_started.py', 'Getting started', 'documentation/getting-started', False),
+    # ('Documentation', 'site/documentation/getting_started.py', 'Develop', 'documentation/develop', False),
+    # ('Documentation', 'site/documentation/getting_started.py', '    AaaS', 'documentation/develop/aaas', False),
+    # ('Documentation', 'site/documentation/getting_started.py', '    Wiki', 'documentation/develop/wiki', False),
+    # ('Documentation', 'site/documentation/getting_started.py', 'Deploy', 'documentation/deploy', False),
+    # ('Documentation', 'site/documentation/getting_started.py', '    Docker', 'documentation/deploy/docker', False),
+    ('CLI reference', 'site/cli_reference/1_assemblit.py', 'assemblit', '%s/app/cli' % _PREFIX, False),
+    ('CLI reference', 'site/cli_reference/2_orchestrator.py', 'orchestrator', '%s/orchestrator/cli' % _PREFIX, False),
+    ('API reference', 'site/api_reference/1_assemblit.py', 'assemblit', _PREFIX, False),
+    ('API reference', 'site/api_reference/1a_setup.py', '    setup', '%s/setup' % _PREFIX, False),
+    ('API reference', 'site/api_reference/1b_blocks.py', '    blocks', '%s/blocks' % _PREFIX, False),
+    ('API reference', 'site/api_reference/1c_pages.py', '    pages', '%s/pages' % _PREFIX, False),
+    ('API reference', 'site/api_reference/1d_toolkit.py', '    toolkit', '%s/toolkit' % _PREFIX, False)
+)
+
+
+def _build_routes() -> dict:
+    """ Constructs the navigation routes from `_PAGE_SPECS`. The `st.Page` objects are built
+    on each run, since `st.navigation` flags the selected page object per session.
+    """
+    routes = {}
+    for section, page, title, url_path, default in _PAGE_SPECS:
+        routes.setdefault(section, []).append(
+            st.Page(page=page, title=title, url_path=url_path, default=default)
+        )
+    return routes
+
+
+page = st.navigation(pages=_build_routes(), position='sidebar')
 page.run()
@@ -1,12 +1,13 @@
 """ Generic web-application """
 
 import os
-from typing import Type, Union, Optional, Any, get_type_hints
-from dataclasses import dataclass, field, fields, asdict
-from assemblit.toolkit import _exceptions
+import functools
+from typing import Union, Optional, get_type_hints
+from dataclasses import dataclass, field, fields
+from assemblit.toolkit import _exceptions, _types
 
 
-@dataclass
+@dataclass(frozen=True)
 class _env():
     """ A `class` that represents the generic web-application environment variables.
 
@@ -68,76 +69,75 @@ class _env():
         environment variable type is invalid.
         """
 
-        # Validate environment variables
-        missing_variables = [name for name, value in self.__dict__.items() if value is None]
-        if missing_variables:
-            raise _exceptions.MissingEnvironmentVariables
-
-        # Validate types
-        type_hints = _env.get_all_type_hints(dataclass_object=type(self))
-
-        # Check the type of field
-        for variable in fields(self):
-            value = getattr(self, variable.name)
-            if not _env.check_type(expected_type=type_hints[variable.name], value=value):
-                raise ValueError(
-                    'Invalid dtype {%s} for {%s}. Expected {%s}.' % (
-                        type(value).__name__,
-                        variable.name,
-                        (variable.type).__name__
-                    )
+        # Validate environment variables and their types in a single pass
+        #   Missing variables take precedence, so the first invalid type is only raised once
+        #   every variable is known to be set
+        invalid = None
+        for name, expected_type in _env._get_field_type_hints(dataclass_object=type(self)):
+            value = self.__dict__[name]
+            if value is None:
+                raise _exceptions.MissingEnvironmentVariables
+            if invalid is None and not _env.check_type(expected_type=expected_type, value=value):
+                invalid = (name, expected_type, value)
+
+        if invalid is not None:
+            name, expected_type, value = invalid
+            raise ValueError(
+                'Invalid dtype {%s} for {%s}. Expected {%s}.' % (
+                    type(value).__name__,
+                    name,
+                    getattr(expected_type, '__name__', expected_type)
                 )
-
-            # Convert relative directory paths to absoluate paths
-            if variable.name in ['ASSEMBLIT_DIR']:
-                setattr(self, variable.name, os.path.abspath(getattr(self, variable.name)))
+            )
+
+        # Convert relative directory paths to absoluate paths
+        #   Absolute paths are only normalized, which avoids resolving the current work-directory
+        object.__setattr__(
+            self,
+            'ASSEMBLIT_DIR',
+            (
+                os.path.normpath(self.ASSEMBLIT_DIR) if os.path.isabs(self.ASSEMBLIT_DIR)
+                else os.path.abspath(self.ASSEMBLIT_DIR)
+            )
+        )
 
     def to_dict(self) -> dict:
         """ Returns the environment variables and values as a dictionary. """
-        return asdict(self)
+        return dict(self.__dict__)
 
     def list_variables(self) -> list:
         """ Returns the environment variable names as a list. """
-        return list(asdict(self).keys())
+        return list(self.__dict__.keys())
 
     def values(self) -> tuple:
         """ Returns the environment variable values as a tuple. """
-        return tuple(asdict(self).values())
+        return tuple(self.__dict__.values())
+
+    # Type-check values with the shared `assemblit.toolkit._types.check_type()`
+    check_type = staticmethod(_types.check_type)
 
-    def check_type(expected_type: Type, value: Any) -> bool:
-        """ Recursively check if a value matches the expected type. This function is
-        compatible with basic types, Union, and Optional.
+    @functools.lru_cache(maxsize=None)
+    def get_all_type_hints(dataclass_object: object) -> dict:
+        """ Get all type hints from the dataclass and all of its bases. `typing.get_type_hints()`
+        walks the method resolution order itself, so the type hints are resolved in a single call,
+        once per dataclass, and cached for subsequent instances.
 
         Parameters
         ----------
-        expected_type : `Type`
-            The expected type assigned to the dataclass field.
-        value : `Any`
-            The value to type check.
+        dataclass_object : `object`
+            The dataclass object.
         """
-        if hasattr(expected_type, '__origin__'):
+        return get_type_hints(dataclass_object)
 
-            # Handle Optional[Type] which is equivalent to Union[Type, None]
-            if expected_type.__origin__ is Union:
-                return any(_env.check_type(arg, value) for arg in expected_type.__args__)
-
-        # For Optional, allow NoneType
-        if isinstance(value, expected_type) or value is None and expected_type is Optional:
-            return True
-
-        return isinstance(value, expected_type)
-
-    def get_all_type_hints(dataclass_object: object) -> dict:
-        """ Get all type hints from the dataclass and all subclasses.
+    @functools.lru_cache(maxsize=None)
+    def _get_field_type_hints(dataclass_object: object) -> tuple:
+        """ Get the name and type hint of each field of the dataclass as a `tuple`. The
+        field metadata is resolved once per dataclass and cached for subsequent instances.
 
         Parameters
         ----------
         dataclass_object : `object`
             The dataclass object.
         """
-        hints = {}
-        for base in dataclass_object.__mro__:
-            if base is object:
-                continue
-            hints.update(get_type_hints(base))
-        return hints
+        type_hints = _env.get_all_type_hints(dataclass_object=dataclass_object)
+        return tuple((variable.name, type_hints[variable.name]) for variable in fields(dataclass_object))
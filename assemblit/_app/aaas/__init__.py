@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from assemblit._app import _generic
 
 
-@dataclass
+@dataclass(frozen=True)
 class env(_generic._env):
     """
     ASSEMBLIT_ENV : `str`
@@ -2,7 +2,6 @@
 
 import os
 from typing import Union, Literal
-from assemblit._app import layer
 
 
 # Define assemblit sub-command function(s)
@@ -35,6 +34,10 @@ def run(
     ```
 
     """
+
+    # Import the web-application layer on first use
+    from assemblit._app import layer
+
     return layer.run(script=script).wait()
 
 
@@ -67,6 +70,9 @@ def build(
     ```
     """
 
+    # Import the web-application layer on first use
+    from assemblit._app import layer
+
     # Get current work-directory
     path = os.getcwd()
 
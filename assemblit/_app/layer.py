@@ -1,16 +1,80 @@
 """ Assemblit web-application """
 
+from __future__ import annotations
 import os
-import shutil
-import subprocess
-import copy
-from typing import Union, Literal, Tuple
+import textwrap
+from typing import Union, Literal, NamedTuple, TYPE_CHECKING
 from pytensils import utils
 import assemblit
 from assemblit import _app
-from assemblit.toolkit import _yaml, content
+from assemblit.toolkit import _exceptions, _yaml, content
 from assemblit._orchestrator import layer
 
+if TYPE_CHECKING:
+    import subprocess
+
+
+# Define the path to the demo web-application script
+_DEMO_SCRIPT_PATH = os.path.join(os.path.dirname(_app.__file__), 'scripts', 'demo.py')
+
+
+# Define the demo web-application content template
+_DEMO_MARKDOWN_TEMPLATE = textwrap.dedent(
+    """
+    Congratulations, you successfully deployed your first Assemblit web-app!
+
+    This deployment built a new `demo` project within `%s`, where you can find the page content, `README.md`, and the Python script that generated this page, `app.py`.
+
+    See `./.assemblit/config.yaml` for the configuration parameters.
+
+    To restart this app, run,
+
+    ```
+    assemblit run app.py
+    ```
+
+    ### Want to learn more?
+    - Check out the documentation at [assemblit.org](%s)
+    """
+)
+
+
+# Define the web-application environment structure
+class AppEnvironment(NamedTuple):
+    """ A `NamedTuple` that contains the loaded web-application environment variables
+    and session-state defaults, returned by `load_app_environment()`. As a `tuple`, the
+    values can be unpacked in field order.
+    """
+
+    ENV: str
+    VERSION: str
+    DEBUG: bool
+    TYPE: str
+    NAME: str
+    HOME_PAGE_NAME: str
+    GITHUB_REPOSITORY_URL: str
+    GITHUB_BRANCH_NAME: str
+    ROOT_DIR: Union[str, os.PathLike]
+    CLIENT_PORT: str
+    AUTH_NAME: str
+    AUTH_QUERY_INDEX: str
+    REQUIRE_AUTHENTICATION: bool
+    DB_DIR: Union[str, os.PathLike, None]
+    USERS_DB_NAME: Union[str, None]
+    USERS_DB_QUERY_INDEX: Union[str, None]
+    SESSIONS_DB_NAME: Union[str, None]
+    SESSIONS_DB_QUERY_INDEX: Union[str, None]
+    DATA_DB_NAME: Union[str, None]
+    DATA_DB_QUERY_INDEX: Union[str, None]
+    ANALYSIS_DB_NAME: Union[str, None]
+    ANALYSIS_DB_QUERY_INDEX: Union[str, None]
+    SESSION_STATE_DEFAULTS: dict
+    AUTH_DEFAULTS: dict
+    USERS_DEFAULTS: Union[dict, None]
+    SESSIONS_DEFAULTS: Union[dict, None]
+    DATA_DEFAULTS: Union[dict, None]
+    ANALYSIS_DEFAULTS: Union[dict, None]
+
 
 # Define abstracted web-application function(s)
 def load_app_environment(
@@ -33,35 +97,9 @@ def load_app_environment(
     data_db_query_index: Union[str, None] = 'dataset_id',
     analysis_db_name: Union[str, None] = 'analysis',
     analysis_db_query_index: Union[str, None] = 'run_id'
-) -> Tuple[
-        str,
-        str,
-        bool,
-        str,
-        str,
-        str,
-        str,
-        str,
-        Union[str, os.PathLike],
-        int,
-        Union[bool, None],
-        Union[str, os.PathLike, None],
-        Union[str, None],
-        Union[str, None],
-        Union[str, None],
-        Union[str, None],
-        Union[str, None],
-        Union[str, None],
-        Union[str, None],
-        Union[str, None],
-        Union[dict, None],
-        Union[dict, None],
-        Union[dict, None],
-        Union[dict, None],
-        Union[dict, None],
-        Union[dict, None]
-]:
-    """ Loads and validates the orchestration server environment variables and returns the values in the following order,
+) -> AppEnvironment:
+    """ Loads and validates the web-application environment variables and returns an `AppEnvironment`
+    containing the values in the following order,
 
     - `ENV`
     - `VERSION`
@@ -73,6 +111,8 @@ def load_app_environment(
     - `GITHUB_BRANCH_NAME`
     - `ROOT_DIR`
     - `CLIENT_PORT`
+    - `AUTH_NAME`
+    - `AUTH_QUERY_INDEX`
     - `REQUIRE_AUTHENTICATION`
     - `DB_DIR`
     - `USERS_DB_NAME`
@@ -160,14 +200,14 @@ def load_app_environment(
         application = _app.aaas.env(
             ASSEMBLIT_ENV=env,
             ASSEMBLIT_VERSION=version,
-            ASSEMBLIT_DEBUG=utils.as_type(debug, return_dtype='bool'),
+            ASSEMBLIT_DEBUG=_as_bool(debug),
             ASSEMBLIT_NAME=name,
             ASSEMBLIT_HOME_PAGE_NAME=home_page_name,
             ASSEMBLIT_GITHUB_REPOSITORY_URL=github_repository_url,
             ASSEMBLIT_GITHUB_BRANCH_NAME=github_branch_name,
             ASSEMBLIT_DIR=root_dir,
-            ASSEMBLIT_CLIENT_PORT=utils.as_type(client_port, return_dtype='int'),
-            ASSEMBLIT_REQUIRE_AUTHENTICATION=utils.as_type(require_authentication, return_dtype='bool'),
+            ASSEMBLIT_CLIENT_PORT=_as_int(client_port),
+            ASSEMBLIT_REQUIRE_AUTHENTICATION=_as_bool(require_authentication),
             ASSEMBLIT_USERS_DB_NAME=users_db_name,
             ASSEMBLIT_USERS_DB_QUERY_INDEX=users_db_query_index,
             ASSEMBLIT_SESSIONS_DB_NAME=sessions_db_name,
@@ -179,7 +219,7 @@ def load_app_environment(
         )
 
         # Validate the port-configuration settings
-        application.ASSEMBLIT_CLIENT_PORT = _yaml.validate_port(
+        client_port = _yaml.validate_port(
             env='app',
             port=application.ASSEMBLIT_CLIENT_PORT
         )
@@ -205,77 +245,81 @@ def load_app_environment(
             'name': None,
             application.ASSEMBLIT_USERS_DB_QUERY_INDEX: users_db_query_index_value
         }
-        session_state_defaults[application.ASSEMBLIT_USERS_DB_NAME] = copy.deepcopy(users_defaults)
 
         # Construct sessions database settings
         sessions_defaults: dict = {
             'name': None,
             application.ASSEMBLIT_SESSIONS_DB_QUERY_INDEX: None
         }
-        session_state_defaults[application.ASSEMBLIT_SESSIONS_DB_NAME] = copy.deepcopy(sessions_defaults)
 
         # Construct data database settings
         data_defaults: dict = {
             'name': None,
             application.ASSEMBLIT_DATA_DB_QUERY_INDEX: None
         }
-        session_state_defaults[application.ASSEMBLIT_DATA_DB_NAME] = copy.deepcopy(data_defaults)
 
         # Construct analysis database settings
         analysis_defaults: dict = {
             'name': None,
             application.ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX: None
         }
-        session_state_defaults[application.ASSEMBLIT_ANALYSIS_DB_NAME] = copy.deepcopy(analysis_defaults)
-
-        return (
-            application.ASSEMBLIT_ENV,
-            application.ASSEMBLIT_VERSION,
-            application.ASSEMBLIT_DEBUG,
-            app_type,
-            application.ASSEMBLIT_NAME,
-            application.ASSEMBLIT_HOME_PAGE_NAME,
-            application.ASSEMBLIT_GITHUB_REPOSITORY_URL,
-            application.ASSEMBLIT_GITHUB_BRANCH_NAME,
-            application.ASSEMBLIT_DIR,
-            application.ASSEMBLIT_CLIENT_PORT,
-            auth_name,
-            auth_query_index,
-            application.ASSEMBLIT_REQUIRE_AUTHENTICATION,
-            os.path.abspath(os.path.join(application.ASSEMBLIT_DIR, 'db')),
-            application.ASSEMBLIT_USERS_DB_NAME,
-            application.ASSEMBLIT_USERS_DB_QUERY_INDEX,
-            application.ASSEMBLIT_SESSIONS_DB_NAME,
-            application.ASSEMBLIT_SESSIONS_DB_QUERY_INDEX,
-            application.ASSEMBLIT_DATA_DB_NAME,
-            application.ASSEMBLIT_DATA_DB_QUERY_INDEX,
-            application.ASSEMBLIT_ANALYSIS_DB_NAME,
-            application.ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX,
-            session_state_defaults,
-            auth_defaults,
-            users_defaults,
-            sessions_defaults,
-            data_defaults,
-            analysis_defaults,
+
+        # Add the database settings to the session-state defaults
+        session_state_defaults.update({
+            application.ASSEMBLIT_USERS_DB_NAME: dict(users_defaults),
+            application.ASSEMBLIT_SESSIONS_DB_NAME: dict(sessions_defaults),
+            application.ASSEMBLIT_DATA_DB_NAME: dict(data_defaults),
+            application.ASSEMBLIT_ANALYSIS_DB_NAME: dict(analysis_defaults)
+        })
+
+        return AppEnvironment(
+            ENV=application.ASSEMBLIT_ENV,
+            VERSION=application.ASSEMBLIT_VERSION,
+            DEBUG=application.ASSEMBLIT_DEBUG,
+            TYPE=app_type,
+            NAME=application.ASSEMBLIT_NAME,
+            HOME_PAGE_NAME=application.ASSEMBLIT_HOME_PAGE_NAME,
+            GITHUB_REPOSITORY_URL=application.ASSEMBLIT_GITHUB_REPOSITORY_URL,
+            GITHUB_BRANCH_NAME=application.ASSEMBLIT_GITHUB_BRANCH_NAME,
+            ROOT_DIR=application.ASSEMBLIT_DIR,
+            CLIENT_PORT=client_port,
+            AUTH_NAME=auth_name,
+            AUTH_QUERY_INDEX=auth_query_index,
+            REQUIRE_AUTHENTICATION=application.ASSEMBLIT_REQUIRE_AUTHENTICATION,
+            DB_DIR=os.path.join(application.ASSEMBLIT_DIR, 'db'),
+            USERS_DB_NAME=application.ASSEMBLIT_USERS_DB_NAME,
+            USERS_DB_QUERY_INDEX=application.ASSEMBLIT_USERS_DB_QUERY_INDEX,
+            SESSIONS_DB_NAME=application.ASSEMBLIT_SESSIONS_DB_NAME,
+            SESSIONS_DB_QUERY_INDEX=application.ASSEMBLIT_SESSIONS_DB_QUERY_INDEX,
+            DATA_DB_NAME=application.ASSEMBLIT_DATA_DB_NAME,
+            DATA_DB_QUERY_INDEX=application.ASSEMBLIT_DATA_DB_QUERY_INDEX,
+            ANALYSIS_DB_NAME=application.ASSEMBLIT_ANALYSIS_DB_NAME,
+            ANALYSIS_DB_QUERY_INDEX=application.ASSEMBLIT_ANALYSIS_DB_QUERY_INDEX,
+            SESSION_STATE_DEFAULTS=session_state_defaults,
+            AUTH_DEFAULTS=auth_defaults,
+            USERS_DEFAULTS=users_defaults,
+            SESSIONS_DEFAULTS=sessions_defaults,
+            DATA_DEFAULTS=data_defaults,
+            ANALYSIS_DEFAULTS=analysis_defaults
         )
 
-    if app_type == 'wiki':
+    elif app_type == 'wiki':
 
         # Initialize the Python package documentation wiki-application
         application = _app.wiki.env(
             ASSEMBLIT_ENV=env,
             ASSEMBLIT_VERSION=version,
-            ASSEMBLIT_DEBUG=utils.as_type(debug, return_dtype='bool'),
+            ASSEMBLIT_DEBUG=_as_bool(debug),
             ASSEMBLIT_NAME=name,
             ASSEMBLIT_HOME_PAGE_NAME=home_page_name,
             ASSEMBLIT_GITHUB_REPOSITORY_URL=github_repository_url,
             ASSEMBLIT_GITHUB_BRANCH_NAME=github_branch_name,
             ASSEMBLIT_DIR=root_dir,
-            ASSEMBLIT_CLIENT_PORT=utils.as_type(client_port, return_dtype='int'),
+            ASSEMBLIT_CLIENT_PORT=_as_int(client_port),
         )
 
         # Validate the port-configuration settings
-        application.ASSEMBLIT_CLIENT_PORT = _yaml.validate_port(
+        client_port = _yaml.validate_port(
             env='app',
             port=application.ASSEMBLIT_CLIENT_PORT
         )
@@ -291,40 +335,45 @@ def load_app_environment(
             session_state_defaults=session_state_defaults
         )
 
-        return (
-            application.ASSEMBLIT_ENV,
-            application.ASSEMBLIT_VERSION,
-            application.ASSEMBLIT_DEBUG,
-            app_type,
-            application.ASSEMBLIT_NAME,
-            application.ASSEMBLIT_HOME_PAGE_NAME,
-            application.ASSEMBLIT_GITHUB_REPOSITORY_URL,
-            application.ASSEMBLIT_GITHUB_BRANCH_NAME,
-            application.ASSEMBLIT_DIR,
-            application.ASSEMBLIT_CLIENT_PORT,
-            auth_name,
-            auth_query_index,
-            False,  # Require authentication
-            None,  # Database directory
-            None,  # Users db name
-            None,  # Users db query-index
-            None,  # Sessions db name
-            None,  # Users db query-index
-            None,  # Data db name
-            None,  # Data db query-index
-            None,  # Analysis db name
-            None,  # Analysis db query-index
-            session_state_defaults,
-            auth_defaults,
-            None,  # Users db defaults
-            None,  # Sessions db defaults
-            None,  # Data db defaults
-            None,  # Analysis db defaults
+        return AppEnvironment(
+            ENV=application.ASSEMBLIT_ENV,
+            VERSION=application.ASSEMBLIT_VERSION,
+            DEBUG=application.ASSEMBLIT_DEBUG,
+            TYPE=app_type,
+            NAME=application.ASSEMBLIT_NAME,
+            HOME_PAGE_NAME=application.ASSEMBLIT_HOME_PAGE_NAME,
+            GITHUB_REPOSITORY_URL=application.ASSEMBLIT_GITHUB_REPOSITORY_URL,
+            GITHUB_BRANCH_NAME=application.ASSEMBLIT_GITHUB_BRANCH_NAME,
+            ROOT_DIR=application.ASSEMBLIT_DIR,
+            CLIENT_PORT=client_port,
+            AUTH_NAME=auth_name,
+            AUTH_QUERY_INDEX=auth_query_index,
+            REQUIRE_AUTHENTICATION=False,
+            DB_DIR=None,
+            USERS_DB_NAME=None,
+            USERS_DB_QUERY_INDEX=None,
+            SESSIONS_DB_NAME=None,
+            SESSIONS_DB_QUERY_INDEX=None,
+            DATA_DB_NAME=None,
+            DATA_DB_QUERY_INDEX=None,
+            ANALYSIS_DB_NAME=None,
+            ANALYSIS_DB_QUERY_INDEX=None,
+            SESSION_STATE_DEFAULTS=session_state_defaults,
+            AUTH_DEFAULTS=auth_defaults,
+            USERS_DEFAULTS=None,
+            SESSIONS_DEFAULTS=None,
+            DATA_DEFAULTS=None,
+            ANALYSIS_DEFAULTS=None
         )
 
+    else:
+        raise _exceptions.InvalidConfiguration('Invalid app type value {%s}.' % (app_type))
+
 
 def create_app(
-    config: dict
+    config: dict,
+    app_type: Union[str, None] = None,
+    environment: Union[dict, None] = None
 ) -> Union[_app.wiki.env, _app.aaas.env]:
     """ Creates the web-application environment.
 
@@ -332,13 +381,25 @@ def create_app(
     ----------
     config : `dict`
         The `assemblit` configuration.
+    app_type : `Union[str, None]`
+        The already known type of web-application. When `None`, the type is loaded
+            from `config`.
+    environment : `Union[dict, None]`
+        The already known web-application environment variables. When `None`, the
+            environment variables are loaded from `config`.
     """
 
     # Load the web-application type
-    app_type = _yaml.load_type(config=config, env='app', supported_types=_app.__all__)
+    if app_type is None:
+        app_type = _yaml.load_type(config=config, env='app', supported_types=_app.__all__)
+    else:
+        app_type = _yaml.validate_type(env='app', type_=app_type, supported_types=_app.__all__)
 
     # Load the web-application environment variables
-    app_environment_dict_object = _yaml.load_environment(config=config, env='app')
+    if environment is None:
+        app_environment_dict_object = _yaml.load_environment(config=config, env='app')
+    else:
+        app_environment_dict_object = environment
 
     if app_type == 'aaas':
 
@@ -346,7 +407,7 @@ def create_app(
         application = _app.aaas.env(**app_environment_dict_object)
 
         # Validate the port-configuration settings
-        application.ASSEMBLIT_CLIENT_PORT = _yaml.validate_port(
+        _ = _yaml.validate_port(
             env='app',
             port=application.ASSEMBLIT_CLIENT_PORT
         )
@@ -354,17 +415,20 @@ def create_app(
         # Create the orchestration server environment
         _ = layer.create_orchestrator(config=config)
 
-    if app_type == 'wiki':
+    elif app_type == 'wiki':
 
         # Initialize the Python package documentation wiki-application
         application = _app.wiki.env(**app_environment_dict_object)
 
         # Validate the port-configuration settings
-        application.ASSEMBLIT_CLIENT_PORT = _yaml.validate_port(
+        _ = _yaml.validate_port(
             env='app',
             port=application.ASSEMBLIT_CLIENT_PORT
         )
 
+    else:
+        raise _exceptions.InvalidConfiguration('Invalid app type value {%s}.' % (app_type))
+
     # Load the environment parameters
     _yaml.create_environment(dict_object={'ASSEMBLIT_APP_TYPE': app_type, **application.to_dict()})
 
@@ -385,8 +449,14 @@ def build(
         The absolute path to the work-directory.
     """
 
+    # Import `shutil` on first use
+    import shutil
+
     if app_type.strip().lower() == 'demo':
 
+        # Resolve the work-directory
+        root_dir = os.path.abspath(path)
+
         # Build the web-application configuration
         config = {
             'assemblit': {
@@ -401,65 +471,44 @@ def build(
                         'ASSEMBLIT_GITHUB_REPOSITORY_URL': 'https://github.com/thomaseleff/assemblit',
                         'ASSEMBLIT_GITHUB_BRANCH_NAME': 'main',
                         'ASSEMBLIT_CLIENT_PORT': 8501,
-                        'ASSEMBLIT_DIR': os.path.abspath(path)
+                        'ASSEMBLIT_DIR': root_dir
                     }
                 }
             }
         }
 
         # Unload the web-application configuration
-        _yaml.unload_configuration(path=os.path.abspath(path), config=config)
+        _yaml.unload_configuration(path=root_dir, config=config)
 
         # Build the web-application content
-        markdown = (
-            """
-            Congratulations, you successfully deployed your first Assemblit web-app!
-
-            This deployment built a new `demo` project within `%s`, where you can find the page content, `README.md`, and the Python script that generated this page, `app.py`.
-
-            See `./.assemblit/config.yaml` for the configuration parameters.
-
-            To restart this app, run,
-
-            ```
-            assemblit run app.py
-            ```
-
-            ### Want to learn more?
-            - Check out the documentation at [assemblit.org](%s)
-            """
-        ) % (
-            os.path.realpath(path),
+        markdown = _DEMO_MARKDOWN_TEMPLATE % (
+            os.path.realpath(root_dir),
             assemblit._URL
         )
 
         # Unload the web-application content
         content.to_markdown(
-            file_path=os.path.join(
-                os.path.abspath(path),
-                'README.md'
-            ),
+            file_path=os.path.join(root_dir, 'README.md'),
             content=markdown
         )
 
         # Unload the Python script
-        shutil.copy(
-            os.path.join(
-                os.path.dirname(_app.__file__),
-                'scripts',
-                'demo.py'
-            ),
-            os.path.join(
-                os.path.abspath(path),
-                'app.py'
-            )
+        shutil.copyfile(
+            _DEMO_SCRIPT_PATH,
+            os.path.join(root_dir, 'app.py')
         )
 
     else:
         raise NotImplementedError('App-type {%s} is not yet supported by `assemblit build`.' % (app_type))
 
     # Create the web-application environment
-    return create_app(config=config)
+    #   The configuration was constructed above, so the type and environment variables
+    #   are passed through directly rather than re-loaded from the configuration
+    return create_app(
+        config=config,
+        app_type=config['assemblit']['app']['type'],
+        environment=config['assemblit']['app']['env']
+    )
 
 
 def run(
@@ -476,18 +525,24 @@ def run(
         The web-application `class` object.
     """
 
+    # Import `subprocess` on first use
+    import subprocess
+
     # Load and create the web-application configuration
     if not application:
         config = _yaml.load_configuration(path=os.path.dirname(os.path.abspath(script)))
         application = create_app(config=config)
 
     # Run the web-application
+    #   The command is passed as an argument list to avoid spawning an intermediate shell
     return subprocess.Popen(
-        'streamlit run %s --server.port %s' % (
+        [
+            'streamlit',
+            'run',
             os.path.abspath(script),
-            application.ASSEMBLIT_CLIENT_PORT
-        ),
-        shell=True
+            '--server.port',
+            str(application.ASSEMBLIT_CLIENT_PORT)
+        ]
     )
 
 
@@ -506,7 +561,7 @@ def _construct_session_state_defaults(
         The filename of the Python script that represents the home-page.
     """
     return {
-        'dir': os.path.abspath(root_dir),
+        'dir': root_dir if os.path.isabs(root_dir) else os.path.abspath(root_dir),
         'pages': {
             'home': '%s.py' % (home_page_name)
         }
@@ -531,6 +586,33 @@ def _construct_authentication_defaults(
         'login-error': False,
         'sign-up-error': False
     }
-    session_state_defaults[auth_name] = copy.deepcopy(auth_defaults)
+    session_state_defaults[auth_name] = dict(auth_defaults)
 
     return (session_state_defaults, auth_name, auth_query_index, auth_defaults)
+
+
+# Define type-conversion functions
+def _as_bool(value: Union[str, bool, None]) -> bool:
+    """ Converts a value to a `bool`, returning the value as-is when it is already a `bool`.
+
+    Parameters
+    ----------
+    value : `Union[str, bool, None]`
+        The value to convert.
+    """
+    if isinstance(value, bool):
+        return value
+    return utils.as_type(value, return_dtype='bool')
+
+
+def _as_int(value: Union[str, int]) -> int:
+    """ Converts a value to an `int`, returning the value as-is when it is already an `int`.
+
+    Parameters
+    ----------
+    value : `Union[str, int]`
+        The value to convert.
+    """
+    if type(value) is int:
+        return value
+    return utils.as_type(value, return_dtype='int')
@@ -13,21 +13,26 @@ from assemblit.pages import home
 setup.LAYOUT = 'centered'
 setup.INITIAL_SIDEBAR_STATE = 'collapsed'
 
+
 # Initialize the home-page content
-Welcome = home.Content(
-    header='🎉 Success!',
-    tagline="""
-        Assemblit is helping data analysts and scientists rapidly scale notebooks into
-         analytics-as-a-service (AaaS) web-applications.
-    """,
-    content_file_path='./README.md',
-    content_info=None
-)
+#   `st.cache_resource` constructs the content once and shares it across reruns and sessions
+@st.cache_resource(show_spinner=False)
+def _welcome() -> home.Content:
+    return home.Content(
+        header='🎉 Success!',
+        tagline="""
+            Assemblit is helping data analysts and scientists rapidly scale notebooks into
+             analytics-as-a-service (AaaS) web-applications.
+        """,
+        content_file_path='./README.md',
+        content_info=None
+    )
+
 
 # Serve content
 # `assemblit` page content must be served first in the Python script
 #   since `assemblit` pages configure st.set_page_config()
-Welcome.serve()
+_welcome().serve()
 
 # Celebrate
 # Other `streamlit` based components can be served after the `assemblit` content
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from assemblit._app import _generic
 
 
-@dataclass
+@dataclass(frozen=True)
 class env(_generic._env):
     """
     ASSEMBLIT_ENV : `str`
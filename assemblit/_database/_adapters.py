@@ -2,6 +2,7 @@
 
 import sqlite3
 import datetime
+import functools
 
 
 # Define sqlite datatype adapter(s) and converter(s)
@@ -56,8 +57,10 @@ class Sqlite():
         """
         return datetime.timedelta(seconds=float(object.decode()))
 
+    @functools.lru_cache(maxsize=None)
     def register():
-        """ Registers all object adapters and converters.
+        """ Registers all object adapters and converters. The registration is
+        performed once per process, subsequent calls are no-ops.
         """
 
         # Register datetime
@@ -6,19 +6,20 @@ Supported dataframe schema-objects,
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import ClassVar, List
+from typing import ClassVar, FrozenSet, TYPE_CHECKING
 import datetime
-import pandera
-import numpy as np
 
+if TYPE_CHECKING:
+    import pandera
 
-@dataclass
+
+@dataclass(frozen=True)
 class _DATATYPE():
     """ A `class` that represents a database datatype.
 
     Attributes
     ----------
-    kinds : `List[str]`
+    kinds : `FrozenSet[str]`
         The `numpy.dtype().kind` values that correspond to the datatype.
     built_in : `type`
         The corresponding python 'built-in' datatype.
@@ -26,35 +27,35 @@ class _DATATYPE():
         The corresponding sqlite3-database datatype.
     """
 
-    kinds: ClassVar[List[str]] = []
+    kinds: ClassVar[FrozenSet[str]] = frozenset()
     built_in: ClassVar[type] = None
     sqlite: ClassVar[str] = 'NULL'
 
     def __repr__(self) -> str:
         if self.built_in:
-            return '%s' % (self.built_in.__name__)
+            return self.built_in.__name__
         else:
             return 'None'
 
     def __name__(self) -> str:
-        return '%s' % (self.sqlite)
+        return self.sqlite
 
     def to_sqlite(self) -> str:
         """ Converts the datatype to a sqlite3-database datatype. """
-        return '%s' % (self.__name__())
+        return self.sqlite
 
-    def to_built_in(self) -> str:
+    def to_built_in(self) -> type:
         """ Converts the datatype to a python 'build-in' datatype. """
         return self.built_in
 
 
-@dataclass
+@dataclass(frozen=True)
 class BLOB(_DATATYPE):
     """ A `class` that represents a `blob` database datatype.
 
     Attributes
     ----------
-    kinds : `List[str]`
+    kinds : `FrozenSet[str]`
         The `numpy.dtype().kind` values that correspond to the datatype.
     built_in : `type`
         The corresponding python 'built-in' datatype.
@@ -62,13 +63,14 @@ class BLOB(_DATATYPE):
         The corresponding sqlite3-database datatype.
     """
 
-    kinds: ClassVar[List[str]] = [
+    kinds: ClassVar[FrozenSet[str]] = frozenset({
         'V',    # Void
-    ]
+    })
     built_in: ClassVar[type] = None
     sqlite: ClassVar[str] = 'BLOB'
 
-    def check(kind: str):
+    @staticmethod
+    def check(kind: str) -> bool:
         """ Returns `True` when the provided `numpy.dtype().kind` corresponds to the datatype.
 
         Parameters
@@ -76,16 +78,16 @@ class BLOB(_DATATYPE):
         kind : `str`
             The `numpy.dtype().kind` of a data object.
         """
-        return True if kind in BLOB.kinds else False
+        return kind in BLOB.kinds
 
 
-@dataclass
+@dataclass(frozen=True)
 class INTEGER(_DATATYPE):
     """ A `class` that represents a `integer` database datatype.
 
     Attributes
     ----------
-    kinds : `List[str]`
+    kinds : `FrozenSet[str]`
         The `numpy.dtype().kind` values that correspond to the datatype.
     built_in : `type`
         The corresponding python 'built-in' datatype.
@@ -93,14 +95,15 @@ class INTEGER(_DATATYPE):
         The corresponding sqlite3-database datatype.
     """
 
-    kinds: ClassVar[List[str]] = [
+    kinds: ClassVar[FrozenSet[str]] = frozenset({
         'i',    # Integer
         'u'     # Unsigned integer
-    ]
+    })
     built_in: ClassVar[type] = int
     sqlite: ClassVar[str] = 'INTEGER'
 
-    def check(kind: str):
+    @staticmethod
+    def check(kind: str) -> bool:
         """ Returns `True` when the provided `numpy.dtype().kind` corresponds to the datatype.
 
         Parameters
@@ -108,16 +111,16 @@ class INTEGER(_DATATYPE):
         kind : `str`
             The `numpy.dtype().kind` of a data object.
         """
-        return True if kind in INTEGER.kinds else False
+        return kind in INTEGER.kinds
 
 
-@dataclass
+@dataclass(frozen=True)
 class REAL(_DATATYPE):
     """ A `class` that represents a `real` database datatype.
 
     Attributes
     ----------
-    kinds : `List[str]`
+    kinds : `FrozenSet[str]`
         The `numpy.dtype().kind` values that correspond to the datatype.
     built_in : `type`
         The corresponding python 'built-in' datatype.
@@ -125,14 +128,15 @@ class REAL(_DATATYPE):
         The corresponding sqlite3-database datatype.
     """
 
-    kinds: ClassVar[List[str]] = [
+    kinds: ClassVar[FrozenSet[str]] = frozenset({
         'f',     # Float
         'c',     # Complex float
-    ]
+    })
     built_in: ClassVar[type] = float
     sqlite: ClassVar[str] = 'FLOAT'
 
-    def check(kind: str):
+    @staticmethod
+    def check(kind: str) -> bool:
         """ Returns `True` when the provided `numpy.dtype().kind` corresponds to the datatype.
 
         Parameters
@@ -140,16 +144,16 @@ class REAL(_DATATYPE):
         kind : `str`
             The `numpy.dtype().kind` of a data object.
         """
-        return True if kind in REAL.kinds else False
+        return kind in REAL.kinds
 
 
-@dataclass
+@dataclass(frozen=True)
 class TEXT(_DATATYPE):
     """ A `class` that represents a `text` database datatype.
 
     Attributes
     ----------
-    kinds : `List[str]`
+    kinds : `FrozenSet[str]`
         The `numpy.dtype().kind` values that correspond to the datatype.
     built_in : `type`
         The corresponding python 'built-in' datatype.
@@ -157,16 +161,17 @@ class TEXT(_DATATYPE):
         The corresponding sqlite3-database datatype.
     """
 
-    kinds: ClassVar[List[str]] = [
+    kinds: ClassVar[FrozenSet[str]] = frozenset({
         'b',    # Boolean
         'O',    # Object
         'S',    # String
         'U',    # Unicode string
-    ]
+    })
     built_in: ClassVar[type] = str
     sqlite: ClassVar[str] = 'TEXT'
 
-    def check(kind: str):
+    @staticmethod
+    def check(kind: str) -> bool:
         """ Returns `True` when the provided `numpy.dtype().kind` corresponds to the datatype.
 
         Parameters
@@ -174,16 +179,16 @@ class TEXT(_DATATYPE):
         kind : `str`
             The `numpy.dtype().kind` of a data object.
         """
-        return True if kind in TEXT.kinds else False
+        return kind in TEXT.kinds
 
 
-@dataclass
+@dataclass(frozen=True)
 class DATETIME(_DATATYPE):
     """ A `class` that represents a `datetime` database datatype.
 
     Attributes
     ----------
-    kinds : `List[str]`
+    kinds : `FrozenSet[str]`
         The `numpy.dtype().kind` values that correspond to the datatype.
     built_in : `type`
         The corresponding python 'built-in' datatype.
@@ -191,13 +196,14 @@ class DATETIME(_DATATYPE):
         The corresponding sqlite3-database datatype.
     """
 
-    kinds: ClassVar[List[str]] = [
+    kinds: ClassVar[FrozenSet[str]] = frozenset({
         'M'     # Datetime
-    ]
+    })
     built_in: ClassVar[type] = datetime.datetime
     sqlite: ClassVar[str] = 'DATETIME'
 
-    def check(kind: str):
+    @staticmethod
+    def check(kind: str) -> bool:
         """ Returns `True` when the provided `numpy.dtype().kind` corresponds to the datatype.
 
         Parameters
@@ -205,16 +211,16 @@ class DATETIME(_DATATYPE):
         kind : `str`
             The `numpy.dtype().kind` of a data object.
         """
-        return True if kind in DATETIME.kinds else False
+        return kind in DATETIME.kinds
 
 
-@dataclass
+@dataclass(frozen=True)
 class TIMEDELTA(_DATATYPE):
     """ A `class` that represents a `timedelta` database datatype.
 
     Attributes
     ----------
-    kinds : `List[str]`
+    kinds : `FrozenSet[str]`
         The `numpy.dtype().kind` values that correspond to the datatype.
     built_in : `type`
         The corresponding python 'built-in' datatype.
@@ -222,13 +228,14 @@ class TIMEDELTA(_DATATYPE):
         The corresponding sqlite3-database datatype.
     """
 
-    kinds: ClassVar[List[str]] = [
+    kinds: ClassVar[FrozenSet[str]] = frozenset({
         'm'     # Timedelta
-    ]
+    })
     built_in: ClassVar[type] = datetime.timedelta
     sqlite: ClassVar[str] = 'TIMEDELTA'
 
-    def check(kind: str):
+    @staticmethod
+    def check(kind: str) -> bool:
         """ Returns `True` when the provided `numpy.dtype().kind` corresponds to the datatype.
 
         Parameters
@@ -236,7 +243,19 @@ class TIMEDELTA(_DATATYPE):
         kind : `str`
             The `numpy.dtype().kind` of a data object.
         """
-        return True if kind in TIMEDELTA.kinds else False
+        return kind in TIMEDELTA.kinds
+
+
+# Define datatype instances
+#   The datatypes carry no instance state, so a single instance of each is shared
+_INSTANCES = {
+    datatype: datatype() for datatype in (BLOB, INTEGER, REAL, TEXT, DATETIME, TIMEDELTA)
+}
+
+# Define the `numpy.dtype().kind` to datatype dispatch table
+_KIND_DISPATCH = {
+    kind: instance for datatype, instance in _INSTANCES.items() for kind in datatype.kinds
+}
 
 
 def from_pandera(datatype: pandera.DataType) -> _DATATYPE:
@@ -248,25 +267,20 @@ def from_pandera(datatype: pandera.DataType) -> _DATATYPE:
         A `pandera.DataType` to convert to an `assemblit.database.datatype`.
     """
 
-    if BLOB.check(np.dtype(datatype.type).kind):
-        return BLOB()
-    elif INTEGER.check(np.dtype(datatype.type).kind):
-        return INTEGER()
-    elif REAL.check(np.dtype(datatype.type).kind):
-        return REAL()
-    elif TEXT.check(np.dtype(datatype.type).kind):
-        return TEXT()
-    elif DATETIME.check(np.dtype(datatype.type).kind):
-        return DATETIME()
-    elif TIMEDELTA.check(np.dtype(datatype.type).kind):
-        return TIMEDELTA()
-    else:
+    # Import `numpy` on first use
+    import numpy as np
+
+    dtype = np.dtype(datatype.type)
+
+    try:
+        return _KIND_DISPATCH[dtype.kind]
+    except KeyError:
         raise UnsupportedTypeError(
             "Datatype {kind: '%s', dtype: '%s'} is not recognized." % (
-                np.dtype(datatype.type).kind,
-                np.dtype(datatype.type)
+                dtype.kind,
+                dtype
             )
-        )
+        ) from None
 
 
 # Define exceptions
@@ -1,7 +1,7 @@
 """ Database table """
 
 from __future__ import annotations
-from typing import List, Literal, Union
+from typing import Callable, List, Literal, Union
 import os
 import sqlite3
 import contextlib
@@ -148,6 +148,35 @@ class Schema(pandera.DataFrameSchema):
         return column_def
 
 
+# Define the lazily constructed database schema `class`
+class LazySchema():
+    """ A `class` that wraps a function returning a `Schema` as a class attribute. The `Schema`
+    is constructed on first access and re-used for all subsequent accesses.
+
+    Parameters
+    ----------
+    factory : `Callable[[], Schema]`
+        The function that constructs the `Schema`.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Schema]
+    ):
+        self.factory = factory
+        self.schema = None
+        self.__doc__ = factory.__doc__
+
+    def __get__(
+        self,
+        instance: object,
+        owner: type
+    ) -> Schema:
+        if self.schema is None:
+            self.schema = self.factory()
+        return self.schema
+
+
 # Define the generic database connection `class`
 class Connection():
     """ A `class` that represents a database connection. """
@@ -1026,7 +1055,7 @@ def parse_db_name(db_name: str) -> str:
     """
     file_name, extension = os.path.splitext(db_name)
 
-    if extension and extension.lower().replace('.', '') in DBMS.OPTIONS:
+    if extension and extension.lower().replace('.', '') in DBMS.OPTIONS_SET:
         return ''.join([file_name, extension.lower()])
     else:
         return '.'.join([file_name, DBMS.DEFAULT])
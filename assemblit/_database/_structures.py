@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import ClassVar, List, Union
+from typing import ClassVar, FrozenSet, List, Union
 
 
 # Define database management system options
@@ -23,6 +23,8 @@ class DBMS():
                 'sqlite3',
                 'sl3'
             ]`
+    OPTIONS_SET : `FrozenSet[str]`
+        The database management systems as a `frozenset`, for membership tests.
     DEFAULT : `str`
         The default database management system, `db`.
     """
@@ -36,6 +38,7 @@ class DBMS():
         'sqlite3',
         'sl3'
     ]
+    OPTIONS_SET: ClassVar[FrozenSet[str]] = frozenset(OPTIONS)
     DEFAULT: ClassVar[str] = 'db'
 
 
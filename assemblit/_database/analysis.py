@@ -1,6 +1,5 @@
 """ Database table """
 
-from typing import ClassVar
 from dataclasses import dataclass
 import pandera
 import datetime
@@ -20,92 +19,94 @@ class Schemas():
     """
 
     # The `analysis` table Schema
-    analysis: ClassVar[_generic.Schema] = _generic.Schema(
-        name=setup.ANALYSIS_DB_NAME,
-        columns={
-            setup.ANALYSIS_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=True,
-                metadata={'primary_key': True}
-            ),
-            'name': pandera.Column(
-                str,
-                nullable=False,
-                unique=True
-            ),
-            'server_type': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            ),
-            'submitted_by': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            ),
-            'created_on': pandera.Column(
-                datetime.datetime,
-                nullable=False,
-                unique=False
-            ),
-            'state': pandera.Column(
-                str,
-                nullable=True,
-                unique=False
-            ),
-            'start_time': pandera.Column(
-                datetime.datetime,
-                nullable=False,
-                unique=False
-            ),
-            'end_time': pandera.Column(
-                datetime.datetime,
-                nullable=True,
-                unique=False
-            ),
-            'run_time': pandera.Column(
-                float,
-                nullable=True,
-                unique=False
-            ),
-            'file_name': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            ),
-            'inputs': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            ),
-            'outputs': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            ),
-            'run_information': pandera.Column(
-                str,
-                nullable=True,
-                unique=False
-            ),
-            'parameters': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            ),
-            'tags': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            ),
-            'url': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            )
-        }
-    )
+    @_generic.LazySchema
+    def analysis() -> _generic.Schema:
+        return _generic.Schema(
+            name=setup.ANALYSIS_DB_NAME,
+            columns={
+                setup.ANALYSIS_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=True,
+                    metadata={'primary_key': True}
+                ),
+                'name': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=True
+                ),
+                'server_type': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                ),
+                'submitted_by': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                ),
+                'created_on': pandera.Column(
+                    datetime.datetime,
+                    nullable=False,
+                    unique=False
+                ),
+                'state': pandera.Column(
+                    str,
+                    nullable=True,
+                    unique=False
+                ),
+                'start_time': pandera.Column(
+                    datetime.datetime,
+                    nullable=False,
+                    unique=False
+                ),
+                'end_time': pandera.Column(
+                    datetime.datetime,
+                    nullable=True,
+                    unique=False
+                ),
+                'run_time': pandera.Column(
+                    float,
+                    nullable=True,
+                    unique=False
+                ),
+                'file_name': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                ),
+                'inputs': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                ),
+                'outputs': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                ),
+                'run_information': pandera.Column(
+                    str,
+                    nullable=True,
+                    unique=False
+                ),
+                'parameters': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                ),
+                'tags': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                ),
+                'url': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                )
+            }
+        )
 
 
 # Define the `analysis` database connection
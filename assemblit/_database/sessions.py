@@ -1,6 +1,5 @@
 """ Database table """
 
-from typing import ClassVar
 from dataclasses import dataclass
 import pandera
 from assemblit import setup
@@ -21,42 +20,46 @@ class Schemas():
     """
 
     # The `data` table Schema
-    data: ClassVar[_generic.Schema] = _generic.Schema(
-        name=setup.DATA_DB_NAME,
-        columns={
-            setup.SESSIONS_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=False,
-                metadata={'primary_key': True}
-            ),
-            setup.DATA_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=False,
-                metadata={'primary_key': True}
-            )
-        }
-    )
+    @_generic.LazySchema
+    def data() -> _generic.Schema:
+        return _generic.Schema(
+            name=setup.DATA_DB_NAME,
+            columns={
+                setup.SESSIONS_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False,
+                    metadata={'primary_key': True}
+                ),
+                setup.DATA_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False,
+                    metadata={'primary_key': True}
+                )
+            }
+        )
 
     # The `analysis` table Schema
-    analysis: ClassVar[_generic.Schema] = _generic.Schema(
-        name=setup.ANALYSIS_DB_NAME,
-        columns={
-            setup.SESSIONS_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=False,
-                metadata={'primary_key': True}
-            ),
-            setup.ANALYSIS_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=False,
-                metadata={'primary_key': True}
-            )
-        }
-    )
+    @_generic.LazySchema
+    def analysis() -> _generic.Schema:
+        return _generic.Schema(
+            name=setup.ANALYSIS_DB_NAME,
+            columns={
+                setup.SESSIONS_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False,
+                    metadata={'primary_key': True}
+                ),
+                setup.ANALYSIS_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False,
+                    metadata={'primary_key': True}
+                )
+            }
+        )
 
 
 # Define the `sessions` database connection
@@ -1,6 +1,5 @@
 """ Database table """
 
-from typing import ClassVar
 from dataclasses import dataclass
 import pandera
 from assemblit import setup
@@ -20,52 +19,56 @@ class Schemas():
         The `users.sessions` database table schema.
     """
 
-    # The `credentials` table Schema.
-    credentials: ClassVar[_generic.Schema] = _generic.Schema(
-        name='credentials',
-        columns={
-            setup.USERS_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=True,
-                metadata={'primary_key': True}
-            ),
-            'username': pandera.Column(
-                str,
-                nullable=False,
-                unique=True
-            ),
-            'password': pandera.Column(
-                str,
-                nullable=False,
-                unique=True
-            ),
-            'first_name': pandera.Column(
-                str,
-                nullable=False,
-                unique=False
-            )
-        }
-    )
+    # The `credentials` table Schema
+    @_generic.LazySchema
+    def credentials() -> _generic.Schema:
+        return _generic.Schema(
+            name='credentials',
+            columns={
+                setup.USERS_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=True,
+                    metadata={'primary_key': True}
+                ),
+                'username': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=True
+                ),
+                'password': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=True
+                ),
+                'first_name': pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False
+                )
+            }
+        )
 
     # The `sessions` table Schema
-    sessions: ClassVar[_generic.Schema] = _generic.Schema(
-        name=setup.SESSIONS_DB_NAME,
-        columns={
-            setup.USERS_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=False,
-                metadata={'primary_key': True}
-            ),
-            setup.SESSIONS_DB_QUERY_INDEX: pandera.Column(
-                str,
-                nullable=False,
-                unique=False,
-                metadata={'primary_key': True}
-            )
-        }
-    )
+    @_generic.LazySchema
+    def sessions() -> _generic.Schema:
+        return _generic.Schema(
+            name=setup.SESSIONS_DB_NAME,
+            columns={
+                setup.USERS_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False,
+                    metadata={'primary_key': True}
+                ),
+                setup.SESSIONS_DB_QUERY_INDEX: pandera.Column(
+                    str,
+                    nullable=False,
+                    unique=False,
+                    metadata={'primary_key': True}
+                )
+            }
+        )
 
 
 # Define the `users` database connection
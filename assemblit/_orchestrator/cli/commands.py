@@ -2,7 +2,6 @@
 
 import os
 from typing import Union
-from assemblit._orchestrator import layer
 
 
 # Define server sub-command function(s)
@@ -37,5 +36,8 @@ def start(
 
     """
 
+    # Import the orchestration server layer on first use
+    from assemblit._orchestrator import layer
+
     # Start the orchestration server
     return layer.start(path=path).wait()
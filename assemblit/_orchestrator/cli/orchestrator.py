@@ -3,9 +3,16 @@
 import sys
 import errno
 import argparse
+import functools
 from assemblit._orchestrator.cli import commands
 
 
+# Define the sub-command dispatch table
+_COMMANDS = {
+    'start': commands.start
+}
+
+
 # Define orchestrator CLI tool function(s)
 def main():
     """
@@ -26,6 +33,30 @@ def main():
     Execute `orchestrator {command} --help` for help.
     """
 
+    # Load the CLI argument parser
+    _ARG_PARSER = _build_parser()
+
+    # Parse arguments
+    _ARGS = _ARG_PARSER.parse_args()
+
+    # Split the sub-command from its arguments
+    _KWARGS = vars(_ARGS)
+    _COMMAND = _KWARGS.pop('command')
+
+    # Return an error when no sub-command is provided
+    if _COMMAND is None:
+        return errno.EINVAL
+
+    # Execute sub-command
+    _COMMANDS[_COMMAND](**_KWARGS)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """ Returns the `orchestrator` CLI argument parser. The parser is built once and cached for
+    subsequent calls to `main()`.
+    """
+
     # Setup CLI argument option(s)
     _ARG_PARSER = argparse.ArgumentParser(
         prog='orchestrator',
@@ -36,6 +67,7 @@ def main():
     # Setup `start` command CLI argument option(s)
     _ARG_SUBPARSER = _ARG_PARSER.add_subparsers(
         title='commands',
+        dest='command',
         prog='orchestrator',
         description='The orchestration server command options.'
     )
@@ -49,17 +81,8 @@ def main():
         help="The relative or absolute path to the current work-directory.",
         type=str
     )
-    _START_ARG_PARSER.set_defaults(func=commands.start)
 
-    # Parse arguments
-    _ARGS = _ARG_PARSER.parse_args()
-    _KWARGS = {key: vars(_ARGS)[key] for key in vars(_ARGS).keys() if key != 'func'}
-
-    # Execute sub-command
-    if _ARG_PARSER.parse_args():
-        _ARGS.func(**_KWARGS)
-    else:
-        return errno.EINVAL
+    return _ARG_PARSER
 
 
 if __name__ == '__main__':
@@ -1,13 +1,32 @@
 """ Workflow orchestration server """
 
+from __future__ import annotations
 import os
-import requests
-from typing import List, Tuple, Union
-from pytensils import utils
+import functools
+from typing import Callable, List, NamedTuple, Tuple, Union
 from assemblit import _orchestrator
 from assemblit.toolkit import _yaml
 
 
+# Define the orchestration server environment structure
+class OrchestratorEnvironment(NamedTuple):
+    """ A `NamedTuple` that contains the loaded orchestration server environment variables,
+    returned by `load_orchestrator_environment()`. As a `tuple`, the values can be unpacked
+    in field order.
+    """
+
+    SERVER_NAME: str
+    SERVER_TYPE: str
+    SERVER_HOST: str
+    SERVER_PORT: int
+    SERVER_API_URL: str
+    SERVER_API_DOCS: str
+    SERVER_JOB_NAME: str
+    SERVER_JOB_ENTRYPOINT: str
+    SERVER_DEPLOYMENT_NAME: str
+    SERVER_DIR: Union[str, os.PathLike]
+
+
 # Define abstracted orchestration server function(s)
 def load_orchestrator_environment(
     server_type: str,
@@ -16,20 +35,9 @@ def load_orchestrator_environment(
     job_entrypoint: str,
     deployment_name: str,
     root_dir: Union[str, os.PathLike]
-) -> Tuple[
-        str,
-        str,
-        str,
-        int,
-        str,
-        str,
-        str,
-        str,
-        str,
-        str,
-        Union[str, os.PathLike]
-]:
-    """ Loads and validates the orchestration server environment variables and returns the values in the following order,
+) -> OrchestratorEnvironment:
+    """ Loads and validates the orchestration server environment variables and returns an
+    `OrchestratorEnvironment` containing the values in the following order,
 
     - `SERVER_NAME`
     - `SERVER_TYPE`
@@ -64,29 +72,28 @@ def load_orchestrator_environment(
     # Validate the orchestration server port
     server_port = _yaml.validate_port(env='orchestrator', port=server_port)
 
-    if server_type == 'prefect':
-
-        # Initialize the `prefect` orchestration server
-        server = _orchestrator.prefect.env(
-            ASSEMBLIT_SERVER_JOB_NAME=job_name,
-            ASSEMBLIT_SERVER_JOB_ENTRYPOINT=os.path.abspath(job_entrypoint),
-            ASSEMBLIT_SERVER_DEPLOYMENT_NAME=deployment_name,
-            ASSEMBLIT_SERVER_DIR=os.path.abspath(root_dir),
-            ASSEMBLIT_SERVER_PORT=utils.as_type(server_port, return_dtype='int')
-        )
+    # Initialize the orchestration server
+    server = _load_server(
+        server_type=server_type,
+        server_port=server_port,
+        job_name=job_name,
+        job_entrypoint=job_entrypoint,
+        deployment_name=deployment_name,
+        root_dir=root_dir
+    )
 
-        return (
-            server.ASSEMBLIT_SERVER_NAME,
-            server.ASSEMBLIT_SERVER_TYPE,
-            server.ASSEMBLIT_SERVER_HOST,
-            server.ASSEMBLIT_SERVER_PORT,
-            server.api_endpoint(),
-            server.docs_endpoint(),
-            server.ASSEMBLIT_SERVER_JOB_NAME,
-            server.ASSEMBLIT_SERVER_JOB_ENTRYPOINT,
-            server.ASSEMBLIT_SERVER_DEPLOYMENT_NAME,
-            server.ASSEMBLIT_SERVER_DIR
-        )
+    return OrchestratorEnvironment(
+        SERVER_NAME=server.ASSEMBLIT_SERVER_NAME,
+        SERVER_TYPE=server.ASSEMBLIT_SERVER_TYPE,
+        SERVER_HOST=server.ASSEMBLIT_SERVER_HOST,
+        SERVER_PORT=server.ASSEMBLIT_SERVER_PORT,
+        SERVER_API_URL=server.api_endpoint(),
+        SERVER_API_DOCS=server.docs_endpoint(),
+        SERVER_JOB_NAME=server.ASSEMBLIT_SERVER_JOB_NAME,
+        SERVER_JOB_ENTRYPOINT=server.ASSEMBLIT_SERVER_JOB_ENTRYPOINT,
+        SERVER_DEPLOYMENT_NAME=server.ASSEMBLIT_SERVER_DEPLOYMENT_NAME,
+        SERVER_DIR=server.ASSEMBLIT_SERVER_DIR
+    )
 
 
 def create_orchestrator(
@@ -106,10 +113,8 @@ def create_orchestrator(
     # Load the orchestration server environment variables
     server_environment_dict_object = _yaml.load_environment(config=config, env='orchestrator')
 
-    if server_type == 'prefect':
-
-        # Initialize the `prefect` orchestration server
-        server = _orchestrator.prefect.env(**server_environment_dict_object)
+    # Initialize the orchestration server
+    server = _SERVERS[server_type].env(**server_environment_dict_object)
 
     # Create the environment variables
     _yaml.create_environment(dict_object={'ASSEMBLIT_SERVER_TYPE': server_type, **server.to_dict()})
@@ -129,7 +134,7 @@ def start(
     """
 
     # Load the orchestration server configuration
-    config = _yaml.load_configuration(path=os.path.abspath(path))
+    config = _yaml.load_configuration(path=_abspath(path))
 
     # Create the orchestration server environment
     server = create_orchestrator(config=config)
@@ -141,7 +146,8 @@ def start(
     server.start()
 
     # Deploy the `prefect` server job
-    return server.deploy(job_entrypoint=os.path.abspath(server.ASSEMBLIT_SERVER_JOB_ENTRYPOINT))
+    #   The job entrypoint is already an absolute path, see `_orchestrator.prefect.env.__post_init__()`
+    return server.deploy(job_entrypoint=server.ASSEMBLIT_SERVER_JOB_ENTRYPOINT)
 
 
 def health_check(
@@ -151,7 +157,7 @@ def health_check(
     job_entrypoint: str,
     deployment_name: str,
     root_dir: Union[str, os.PathLike]
-) -> Union[requests.Response, bool]:
+) -> bool:
     """ Checks the health of the orchestration server and returns `True` when
     the server is available.
 
@@ -174,16 +180,15 @@ def health_check(
     # Validate the orchestration server type
     server_type = _yaml.validate_type(env='orchestrator', type_=server_type, supported_types=_orchestrator.__all__)
 
-    if server_type == 'prefect':
-
-        # Initialize the `prefect` orchestration server
-        server = _orchestrator.prefect.env(
-            ASSEMBLIT_SERVER_JOB_NAME=job_name,
-            ASSEMBLIT_SERVER_JOB_ENTRYPOINT=os.path.abspath(job_entrypoint),
-            ASSEMBLIT_SERVER_DEPLOYMENT_NAME=deployment_name,
-            ASSEMBLIT_SERVER_DIR=os.path.abspath(root_dir),
-            ASSEMBLIT_SERVER_PORT=utils.as_type(server_port, return_dtype='int')
-        )
+    # Initialize the orchestration server
+    server = _load_server(
+        server_type=server_type,
+        server_port=server_port,
+        job_name=job_name,
+        job_entrypoint=job_entrypoint,
+        deployment_name=deployment_name,
+        root_dir=root_dir
+    )
 
     return server.health_check()
 
@@ -223,16 +228,15 @@ def run_job(
     # Validate the orchestration server type
     server_type = _yaml.validate_type(env='orchestrator', type_=server_type, supported_types=_orchestrator.__all__)
 
-    if server_type == 'prefect':
-
-        # Initialize the `prefect` orchestration server
-        server = _orchestrator.prefect.env(
-            ASSEMBLIT_SERVER_JOB_NAME=job_name,
-            ASSEMBLIT_SERVER_JOB_ENTRYPOINT=os.path.abspath(job_entrypoint),
-            ASSEMBLIT_SERVER_DEPLOYMENT_NAME=deployment_name,
-            ASSEMBLIT_SERVER_DIR=os.path.abspath(root_dir),
-            ASSEMBLIT_SERVER_PORT=utils.as_type(server_port, return_dtype='int')
-        )
+    # Initialize the orchestration server
+    server = _load_server(
+        server_type=server_type,
+        server_port=server_port,
+        job_name=job_name,
+        job_entrypoint=job_entrypoint,
+        deployment_name=deployment_name,
+        root_dir=root_dir
+    )
 
     return server.run_job(
         name=name,
@@ -274,16 +278,15 @@ def poll_job_run(
     # Validate the orchestration server type
     server_type = _yaml.validate_type(env='orchestrator', type_=server_type, supported_types=_orchestrator.__all__)
 
-    if server_type == 'prefect':
-
-        # Initialize the `prefect` orchestration server
-        server = _orchestrator.prefect.env(
-            ASSEMBLIT_SERVER_JOB_NAME=job_name,
-            ASSEMBLIT_SERVER_JOB_ENTRYPOINT=os.path.abspath(job_entrypoint),
-            ASSEMBLIT_SERVER_DEPLOYMENT_NAME=deployment_name,
-            ASSEMBLIT_SERVER_DIR=os.path.abspath(root_dir),
-            ASSEMBLIT_SERVER_PORT=utils.as_type(server_port, return_dtype='int')
-        )
+    # Initialize the orchestration server
+    server = _load_server(
+        server_type=server_type,
+        server_port=server_port,
+        job_name=job_name,
+        job_entrypoint=job_entrypoint,
+        deployment_name=deployment_name,
+        root_dir=root_dir
+    )
 
     return server.poll_job_run(run_id=run_id)
 
@@ -302,8 +305,7 @@ def all_job_states(
     # Validate the orchestration server type
     server_type = _yaml.validate_type(env='orchestrator', type_=server_type, supported_types=_orchestrator.__all__)
 
-    if server_type == 'prefect':
-        return [str(state).upper() for state in list(_orchestrator.prefect.STATES.keys())]
+    return list(_SERVERS[server_type].job_states)
 
 
 def all_job_statuses(
@@ -320,8 +322,7 @@ def all_job_statuses(
     # Validate the orchestration server type
     server_type = _yaml.validate_type(env='orchestrator', type_=server_type, supported_types=_orchestrator.__all__)
 
-    if server_type == 'prefect':
-        return [str(status) for status in list(_orchestrator.prefect.STATES.values())]
+    return list(_SERVERS[server_type].job_statuses)
 
 
 def terminal_job_states(
@@ -338,5 +339,132 @@ def terminal_job_states(
     # Validate the orchestration server type
     server_type = _yaml.validate_type(env='orchestrator', type_=server_type, supported_types=_orchestrator.__all__)
 
-    if server_type == 'prefect':
-        return [str(state) for state in _orchestrator.prefect.TERMINAL_STATES]
+    return list(_SERVERS[server_type].terminal_job_states)
+
+
+# Define orchestration server constructing function(s)
+def _load_server(
+    server_type: str,
+    server_port: Union[str, int],
+    job_name: str,
+    job_entrypoint: str,
+    deployment_name: str,
+    root_dir: Union[str, os.PathLike]
+):
+    """ Normalizes the orchestration server arguments and returns the orchestration server
+    environment for the validated `server_type`.
+
+    Parameters
+    ----------
+    server_type : `str`
+        The validated type of orchestration server.
+    server_port : `Union[str, int]`
+        The registered port address of the orchestration server.
+    job_name : `str`
+        The name of the job.
+    job_entrypoint : `str`
+        The Python entrypoint of the job.
+    deployment_name: `str`
+        The name of the job-deployment.
+    root_dir : `Union[str, os.PathLike]`
+        Local directory path of the orchestration server.
+    """
+    return _SERVERS[server_type].load(
+        job_name=job_name,
+        job_entrypoint=_abspath(job_entrypoint),
+        deployment_name=deployment_name,
+        root_dir=_abspath(root_dir),
+        server_port=server_port if type(server_port) is int else int(server_port)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _prefect_env(
+    job_name: str,
+    job_entrypoint: str,
+    deployment_name: str,
+    root_dir: str,
+    server_port: int
+) -> _orchestrator.prefect.env:
+    """ Constructs the `prefect` orchestration server environment. The environment is
+    cached per set of arguments, so repeated calls, e.g. while polling a job-run,
+    re-use the same instance.
+
+    Parameters
+    ----------
+    job_name : `str`
+        The name of the job.
+    job_entrypoint : `str`
+        The absolute path of the Python entrypoint of the job.
+    deployment_name: `str`
+        The name of the job-deployment.
+    root_dir : `str`
+        The absolute local directory path of the orchestration server.
+    server_port : `int`
+        The registered port address of the orchestration server.
+    """
+    return _orchestrator.prefect.env(
+        ASSEMBLIT_SERVER_JOB_NAME=job_name,
+        ASSEMBLIT_SERVER_JOB_ENTRYPOINT=job_entrypoint,
+        ASSEMBLIT_SERVER_DEPLOYMENT_NAME=deployment_name,
+        ASSEMBLIT_SERVER_DIR=root_dir,
+        ASSEMBLIT_SERVER_PORT=server_port
+    )
+
+
+# Define the orchestration server registry
+class _Server(NamedTuple):
+    """ A `NamedTuple` that contains the implementation of an orchestration server.
+
+    Attributes
+    ----------
+    env : `type`
+        The orchestration server environment `class`.
+    load : `Callable`
+        The cached function that constructs the orchestration server environment.
+    job_states : `Tuple[str, ...]`
+        All job-run states.
+    job_statuses : `Tuple[str, ...]`
+        All job-run statuses, in the same order as `job_states`.
+    terminal_job_states : `Tuple[str, ...]`
+        The terminal job-run states.
+    """
+
+    env: type
+    load: Callable
+    job_states: Tuple[str, ...]
+    job_statuses: Tuple[str, ...]
+    terminal_job_states: Tuple[str, ...]
+
+
+# Register the orchestration server(s)
+#   Each supported orchestration server is registered once, by server type, so the
+#   abstracted functions dispatch with a single lookup rather than branching on the type
+_SERVERS = {
+    'prefect': _Server(
+        env=_orchestrator.prefect.env,
+        load=_prefect_env,
+        job_states=tuple(str(state).upper() for state in _orchestrator.prefect.STATES.keys()),
+        job_statuses=tuple(str(status) for status in _orchestrator.prefect.STATES.values()),
+        terminal_job_states=tuple(
+            str(state) for state in _orchestrator.prefect.STATES.keys()
+            if state in _orchestrator.prefect.TERMINAL_STATES
+        )
+    )
+}
+
+
+# Define path function(s)
+def _abspath(
+    path: Union[str, os.PathLike]
+) -> str:
+    """ Returns the absolute path of `path`. Absolute paths are only normalized, which
+    avoids resolving the current work-directory, and relative paths are resolved against
+    the current work-directory at the time of the call.
+
+    Parameters
+    ----------
+    path : `Union[str, os.PathLike]`
+        The relative or absolute path.
+    """
+    return os.path.normpath(path) if os.path.isabs(path) else os.path.abspath(path)
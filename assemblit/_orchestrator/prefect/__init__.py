@@ -2,14 +2,17 @@
 
 import os
 import sys
+import functools
+import threading
 import time
-import subprocess
-import requests
-from typing import List, Union, Optional
-from dataclasses import dataclass, field, fields, asdict
-from assemblit.toolkit import _exceptions
+from typing import Dict, FrozenSet, Tuple, Type, Union, Optional, TYPE_CHECKING
+from dataclasses import dataclass, field, fields
+from assemblit.toolkit import _exceptions, _types
 from assemblit._orchestrator import status
 
+if TYPE_CHECKING:
+    import requests
+
 
 # Job-run state settings
 STATES: dict = {
@@ -26,7 +29,29 @@ STATES: dict = {
     'FAILED': status.FAILED,
     'CRASHED': status.CRASHED
 }
-TERMINAL_STATES: List[str] = ['CANCELLED', 'COMPLETED', 'FAILED', 'CRASHED']
+TERMINAL_STATES: FrozenSet[str] = frozenset({'CANCELLED', 'COMPLETED', 'FAILED', 'CRASHED'})
+
+#   Upper-case job-run states, by `prefect` state name, filled as state names are returned
+#   by the `prefect` server, see `_state()`
+_STATE_NAMES: Dict[str, str] = {}
+
+# Health-check settings
+#   The (connect, read) timeout in seconds, so that a probe against a server that is
+#   still starting fails fast instead of blocking
+HEALTH_CHECK_TIMEOUT: Tuple[float, float] = (0.25, 5)
+
+# REST API request settings
+#   The (connect, read) timeout in seconds of all other REST API requests
+REQUEST_TIMEOUT: Tuple[float, float] = (1, 10)
+
+# Csrf-token settings
+#   The number of seconds a csrf-token is re-used, kept below the one-hour default
+#   expiration of the `prefect` server
+TOKEN_TTL: float = 3000
+
+# Environment variable settings
+#   Relative directory paths are converted to absolute paths
+_PATH_VARIABLES: FrozenSet[str] = frozenset({'ASSEMBLIT_SERVER_JOB_ENTRYPOINT', 'ASSEMBLIT_SERVER_DIR'})
 
 
 @dataclass
@@ -85,67 +110,135 @@ class env():
         environment variable type is invalid.
         """
 
-        # Validate environment variables
-        missing_variables = [name for name, value in self.__dict__.items() if value is None]
-        if missing_variables:
+        # Validate environment variables, stopping at the first missing variable
+        if any(value is None for value in self.__dict__.values()):
             raise _exceptions.MissingEnvironmentVariables
 
         # Validate types
-        for variable in fields(self):
-            value = getattr(self, variable.name)
-            if not isinstance(value, variable.type):
+        for name, expected_type, is_path in _get_field_validators(dataclass_object=type(self)):
+            value = getattr(self, name)
+            if not _types.check_type(expected_type=expected_type, value=value):
                 raise ValueError(
                     'Invalid dtype {%s} for {%s}. Expected {%s}.' % (
                         type(value).__name__,
-                        variable.name,
-                        (variable.type).__name__
+                        name,
+                        getattr(expected_type, '__name__', expected_type)
                     )
                 )
 
             # Convert relative directory paths to absoluate paths
-            if variable.name in ['ASSEMBLIT_SERVER_JOB_ENTRYPOINT', 'ASSEMBLIT_SERVER_DIR']:
-                setattr(self, variable.name, os.path.abspath(getattr(self, variable.name)))
+            #   Absolute paths, e.g., from the orchestrator layer, are only normalized,
+            #   which avoids resolving the current work-directory
+            if is_path:
+                setattr(self, name, os.path.normpath(value) if os.path.isabs(value) else os.path.abspath(value))
+
+        # Build the static REST API endpoints once
+        #   The host, port and routes do not change after initialization
+        self._api_endpoint = 'http://%s:%s/%s' % (
+            self.ASSEMBLIT_SERVER_HOST,
+            self.ASSEMBLIT_SERVER_PORT,
+            self.ASSEMBLIT_SERVER_API_ROUTE
+        )
+        self._docs_endpoint = 'http://%s:%s/%s' % (
+            self.ASSEMBLIT_SERVER_HOST,
+            self.ASSEMBLIT_SERVER_PORT,
+            self.ASSEMBLIT_SERVER_API_DOCS
+        )
+        self._health_endpoint = '/'.join([self._api_endpoint, 'health'])
+        self._token_endpoint = '/'.join([self._api_endpoint, 'csrf-token'])
+
+        # Initialize the REST API session
+        #   The session is not an environment variable, so it is not a dataclass field
+        #   and is excluded from `to_dict()`, `list_variables()` and `values()`. The session
+        #   is created on first use, see `_session`, and shared by all threads, e.g., the
+        #   script threads of Streamlit re-runs, so that pooled connections are re-used.
+        self._requests_session = None
+
+        # Initialize the deployment-id and csrf-token caches
+        #   The session and the caches are shared across threads, so creating the session
+        #   and all cache reads and writes hold `_lock`
+        self._lock = threading.Lock()
+        self._deployment_ids = {}
+        self._token = None
+        self._token_expires = 0.0
 
     def to_dict(self) -> dict:
         """ Returns the environment variables and values as a dictionary. """
-        return asdict(self)
+        return {variable.name: getattr(self, variable.name) for variable in fields(self)}
 
     def list_variables(self) -> list:
         """ Returns the environment variable names as a list. """
-        return list(asdict(self).keys())
+        return [variable.name for variable in fields(self)]
 
     def values(self) -> tuple:
         """ Returns the environment variable values as a tuple. """
-        return tuple(asdict(self).values())
+        return tuple(getattr(self, variable.name) for variable in fields(self))
+
+    @property
+    def _session(self) -> 'requests.Session':
+        """ Returns the REST API session, creating the session on first use so that `requests`
+        is only imported once the `prefect` orchestration server is requested.
+        """
+        if self._requests_session is None:
+            with self._lock:
+                if self._requests_session is None:
+                    self._requests_session = self._create_session()
+        return self._requests_session
+
+    def _create_session(self) -> 'requests.Session':
+        """ Returns a `requests.Session` that re-uses connections to the `prefect` orchestration
+        server across REST API requests and retries transient server errors.
+
+        Only idempotent `GET` and `HEAD` requests are retried, so a `flow` run is never
+        created twice. Connection errors are not retried, so that a health-check against a
+        server that is not running fails immediately.
+        """
+
+        # Import `requests` on first use
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        session = requests.Session()
+        session.mount(
+            'http://',
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    connect=0,
+                    read=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=['GET', 'HEAD'],
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            )
+        )
+        return session
 
     # Define class method(s) for generating API-endpoints
     def api_endpoint(self) -> str:
         """ Returns the `prefect` server REST API endpoint.
         """
-        return 'http://%s:%s/%s' % (
-            self.ASSEMBLIT_SERVER_HOST,
-            self.ASSEMBLIT_SERVER_PORT,
-            self.ASSEMBLIT_SERVER_API_ROUTE
-        )
+        return self._api_endpoint
 
     def docs_endpoint(self) -> str:
         """ Returns the `prefect` server REST API documentation endpoint.
         """
-        return 'http://%s:%s/%s' % (
-            self.ASSEMBLIT_SERVER_HOST,
-            self.ASSEMBLIT_SERVER_PORT,
-            self.ASSEMBLIT_SERVER_API_DOCS
-        )
+        return self._docs_endpoint
 
     def health_endpoint(self) -> str:
         """ Returns the `prefect` server health-check REST API endpoint.
         """
-        return '/'.join([self.api_endpoint(), 'health'])
+        return self._health_endpoint
 
     def token_endpoint(self) -> str:
         """ Returns the `prefect` server csrf-token REST API endpoint.
         """
-        return '/'.join([self.api_endpoint(), 'csrf-token'])
+        return self._token_endpoint
 
     def deployment_id_endpoint(
         self,
@@ -161,7 +254,7 @@ class env():
         deployment_name : `str`
             The name of the `prefect` `deployment`.
         """
-        return '/'.join([self.api_endpoint(), 'deployments', 'name', job_name, deployment_name])
+        return '/'.join([self._api_endpoint, 'deployments', 'name', job_name, deployment_name])
 
     def run_job_endpoint(
         self,
@@ -174,7 +267,7 @@ class env():
         deployment_id : `str`
             The id of the `prefect` `deployment`.
         """
-        return '/'.join([self.api_endpoint(), 'deployments', deployment_id, 'create_flow_run'])
+        return '/'.join([self._api_endpoint, 'deployments', deployment_id, 'create_flow_run'])
 
     def poll_job_run_endpoint(
         self,
@@ -187,13 +280,16 @@ class env():
         run_id : `str`
             The id of a recent `prefect` `flow` run.
         """
-        return '/'.join([self.api_endpoint(), 'flow_runs', run_id])
+        return '/'.join([self._api_endpoint, 'flow_runs', run_id])
 
     # Define class method(s) for configuring the orchestration server
     def configure(self) -> str:
         """ Configures the `prefect` orchestration server.
         """
 
+        # Import `subprocess` on first use
+        import subprocess
+
         # Create the database directory if it does not exist
         if not os.path.exists(self.ASSEMBLIT_SERVER_DIR):
             os.mkdir(self.ASSEMBLIT_SERVER_DIR)
@@ -201,14 +297,14 @@ class env():
         # Set environment variables that cannot be configured via the CLI
         os.environ['PREFECT_HOME'] = self.ASSEMBLIT_SERVER_DIR
 
-        # Return the configuration command(s)
-        configure = subprocess.Popen(
-            ' && '.join([
-                'prefect config set PREFECT_API_URL="%s"' % (self.api_endpoint()),
-                'prefect config set PREFECT_CLI_WRAP_LINES="false"'
-            ]),
-            shell=True
-        )
+        # Run the configuration command
+        #   `prefect config set` accepts multiple settings, so all settings are applied
+        #   by a single `prefect` CLI process
+        configure = subprocess.Popen([
+            'prefect', 'config', 'set',
+            'PREFECT_API_URL=%s' % (self.api_endpoint()),
+            'PREFECT_CLI_WRAP_LINES=false'
+        ])
 
         # Communicate
         _, _ = configure.communicate()
@@ -222,17 +318,23 @@ class env():
     def start(self):
         """ Starts the `prefect` orchestration server.
         """
-        orchestrator = subprocess.Popen(
-            'prefect server start --host="%s" --port="%s"' % (
-                self.ASSEMBLIT_SERVER_HOST,
-                self.ASSEMBLIT_SERVER_PORT
-            ),
-            shell=True
-        )
+
+        # Import `subprocess` on first use
+        import subprocess
+
+        orchestrator = subprocess.Popen([
+            'prefect', 'server', 'start',
+            '--host', self.ASSEMBLIT_SERVER_HOST,
+            '--port', str(self.ASSEMBLIT_SERVER_PORT)
+        ])
 
         # Wait for healthy response
+        #   Probe frequently at first so that a fast-starting server is available
+        #   immediately, then back-off to one probe per second for slow starts
+        delay = 0.05
         while not self.health_check():
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 2, 1)
 
         return orchestrator
 
@@ -248,38 +350,65 @@ class env():
             The filename of the python executable that contains the definition
                 of the `prefect` `flow`.
         """
-        return subprocess.Popen(
-            '"%s" "%s"' % (sys.executable, job_entrypoint),
-            shell=True
-        )
 
-    def health_check(self) -> Union[requests.Response, bool]:
+        # Import `subprocess` on first use
+        import subprocess
+
+        return subprocess.Popen([sys.executable, job_entrypoint])
+
+    def health_check(self) -> bool:
         """ Checks the health of the `prefect` orchestration server.
         Returns `True` when the `prefect` orchestration server is available.
         """
+
+        # Import `requests` on first use
+        import requests
+
         try:
-            return requests.get(self.health_endpoint())
-        except requests.exceptions.ConnectionError:
+            with self._session.get(self.health_endpoint(), timeout=HEALTH_CHECK_TIMEOUT) as response:
+                return response.ok
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             return False
 
-    def get_token(self) -> Union[requests.Response, None]:
-        """ Returns a `prefect` orchestration server csrf-token.
+    def get_token(self) -> Union[str, None]:
+        """ Returns a `prefect` orchestration server csrf-token. The csrf-token is cached
+        and re-used until `TOKEN_TTL` seconds have elapsed.
         """
+
+        # Import `requests` on first use
+        import requests
+
+        # Return the cached csrf-token
+        with self._lock:
+            if self._token is not None and time.monotonic() < self._token_expires:
+                return self._token
+
         try:
-            return requests.get(
+            token = self._session.get(
                 self.token_endpoint(),
-                params={'client': self.ASSEMBLIT_SERVER_NAME}
+                params={'client': self.ASSEMBLIT_SERVER_NAME},
+                timeout=REQUEST_TIMEOUT
             ).json()['token']
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             return None
 
+        # Cache the csrf-token
+        with self._lock:
+            self._token = token
+            self._token_expires = time.monotonic() + TOKEN_TTL
+
+        return token
+
     def get_deployment_id(
         self,
         job_name: str,
         deployment_name: str
-    ) -> Union[requests.Response, None]:
+    ) -> Union[str, None]:
         """ Returns a `prefect` orchestration server `deployment` id.
 
+        The `deployment` id is stable for the lifetime of the `deployment`, so it is cached
+        per `job_name` and `deployment_name` after the first successful request.
+
         Parameters
         ----------
         job_name : `str`
@@ -287,16 +416,32 @@ class env():
         deployment_name : `str`
             The name of the `prefect` `deployment`.
         """
+
+        # Import `requests` on first use
+        import requests
+
+        # Return the cached deployment id
+        with self._lock:
+            if (job_name, deployment_name) in self._deployment_ids:
+                return self._deployment_ids[(job_name, deployment_name)]
+
         try:
-            return requests.get(
+            deployment_id = self._session.get(
                 self.deployment_id_endpoint(
                     job_name=job_name,
                     deployment_name=deployment_name
-                )
+                ),
+                timeout=REQUEST_TIMEOUT
             ).json()['id']
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             return None
 
+        # Cache the deployment id
+        with self._lock:
+            self._deployment_ids[(job_name, deployment_name)] = deployment_id
+
+        return deployment_id
+
     def run_job(
         self,
         name: str,
@@ -304,7 +449,8 @@ class env():
         deployment_name: str,
         **kwargs: dict
     ) -> Union[dict, None]:
-        """ Creates a `prefect` orchestration server `flow` run from a `deployment`.
+        """ Creates a `prefect` orchestration server `flow` run from a `deployment`. Returns
+        `None` when the orchestration server is unavailable.
 
         Parameters
         ----------
@@ -317,28 +463,45 @@ class env():
         **kwargs : `dict`
             The `flow` run parameters.
         """
+
+        # Import `requests` on first use
+        import requests
+
         try:
-            flow_run = requests.post(
-                self.run_job_endpoint(
-                    deployment_id=self.get_deployment_id(
-                        job_name=job_name,
-                        deployment_name=deployment_name
-                    )
-                ),
-                json={
-                    'name': name,
-                    'tags': [self.ASSEMBLIT_SERVER_NAME],
-                    'parameters': kwargs
-                },
-                headers={
-                    'prefect-csrf-token': self.get_token(),
-                    'prefect-csrf-client': self.ASSEMBLIT_SERVER_NAME,
-                }
-            ).json()
+            deployment_id = self.get_deployment_id(job_name=job_name, deployment_name=deployment_name)
+            token = self.get_token()
+            if deployment_id is None or token is None:
+                return None
+            flow_run = self._create_flow_run(
+                name=name,
+                deployment_id=deployment_id,
+                token=token,
+                parameters=kwargs
+            )
+
+            # Retry once with a fresh deployment id and csrf-token when either cached value
+            #   is stale, e.g., after the `flow` was re-deployed or the csrf-token expired
+            if 'id' not in flow_run:
+                self._invalidate(
+                    job_name=job_name,
+                    deployment_name=deployment_name,
+                    deployment_id=deployment_id,
+                    token=token
+                )
+                deployment_id = self.get_deployment_id(job_name=job_name, deployment_name=deployment_name)
+                token = self.get_token()
+                if deployment_id is None or token is None:
+                    return None
+                flow_run = self._create_flow_run(
+                    name=name,
+                    deployment_id=deployment_id,
+                    token=token,
+                    parameters=kwargs
+                )
 
             return {
                 'id': flow_run['id'],
-                'state': str(flow_run['state']['name']).upper(),
+                'state': _state(name=flow_run['state']['name']),
                 'start_time': flow_run['start_time'],
                 'end_time': flow_run['end_time'],
                 'run_time': flow_run['total_run_time'],
@@ -350,9 +513,75 @@ class env():
                     flow_run['id']
                 )
             }
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             return None
 
+    def _invalidate(
+        self,
+        job_name: str,
+        deployment_name: str,
+        deployment_id: str,
+        token: str
+    ):
+        """ Removes a stale deployment id and csrf-token from the caches. A cached value is
+        only removed when it is the value that was used, so that a fresh value cached by
+        another thread in the meantime is kept.
+
+        Parameters
+        ----------
+        job_name : `str`
+            The name of the `prefect` `flow`.
+        deployment_name : `str`
+            The name of the `prefect` `deployment`.
+        deployment_id : `str`
+            The id of the `prefect` `deployment` that was used.
+        token : `str`
+            The csrf-token that was used.
+        """
+        with self._lock:
+            if (
+                (job_name, deployment_name) in self._deployment_ids
+                and self._deployment_ids[(job_name, deployment_name)] == deployment_id
+            ):
+                del self._deployment_ids[(job_name, deployment_name)]
+            if self._token == token:
+                self._token = None
+
+    def _create_flow_run(
+        self,
+        name: str,
+        deployment_id: str,
+        token: str,
+        parameters: dict
+    ) -> dict:
+        """ Posts a `prefect` orchestration server `flow` run and returns the response as a
+        dictionary.
+
+        Parameters
+        ----------
+        name : `str`
+            The name of the `prefect` `flow` run.
+        deployment_id : `str`
+            The id of the `prefect` `deployment`.
+        token : `str`
+            The `prefect` orchestration server csrf-token.
+        parameters : `dict`
+            The `flow` run parameters.
+        """
+        return self._session.post(
+            self.run_job_endpoint(deployment_id=deployment_id),
+            json={
+                'name': name,
+                'tags': [self.ASSEMBLIT_SERVER_NAME],
+                'parameters': parameters
+            },
+            headers={
+                'prefect-csrf-token': token,
+                'prefect-csrf-client': self.ASSEMBLIT_SERVER_NAME,
+            },
+            timeout=REQUEST_TIMEOUT
+        ).json()
+
     def poll_job_run(
         self,
         run_id: str
@@ -364,14 +593,109 @@ class env():
         run_id : `str`
             The id of a `prefect` `flow` run.
         """
+
+        # Import `requests` on first use
+        import requests
+
         try:
-            flow_run = requests.get(self.poll_job_run_endpoint(run_id=run_id)).json()
+            flow_run = self._session.get(
+                self.poll_job_run_endpoint(run_id=run_id),
+                timeout=REQUEST_TIMEOUT
+            ).json()
 
             return {
-                'state': str(flow_run['state']['name']).upper(),
+                'state': _state(name=flow_run['state']['name']),
                 'start_time': flow_run['start_time'],
                 'end_time': flow_run['end_time'],
                 'run_time': flow_run['total_run_time']
             }
-        except requests.exceptions.ConnectionError:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
             return None
+
+    def wait_until_terminal(
+        self,
+        run_id: str,
+        initial_interval: float = 0.2,
+        max_interval: float = 5.0,
+        timeout: Union[float, None] = None
+    ) -> Union[dict, None]:
+        """ Polls the status of a `prefect` orchestration server flow-run until the flow-run
+        reaches a terminal state and returns the last status. The polling interval starts at
+        `initial_interval` and backs-off up to `max_interval`, so short flow-runs are
+        observed quickly while long flow-runs are not polled excessively. Prefer this
+        method over polling `poll_job_run()` in a fixed-interval loop.
+
+        Returns `None` when the orchestration server is unavailable, and the last status
+        when `timeout` elapses before the flow-run reaches a terminal state.
+
+        Parameters
+        ----------
+        run_id : `str`
+            The id of a `prefect` `flow` run.
+        initial_interval : `float`
+            The initial number of seconds between polls.
+        max_interval : `float`
+            The maximum number of seconds between polls.
+        timeout : `Union[float, None]`
+            The maximum number of seconds to wait, or `None` to wait indefinitely.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = initial_interval
+
+        while True:
+            job_run = self.poll_job_run(run_id=run_id)
+
+            # Return the status of terminal or unavailable flow-runs
+            if job_run is None or job_run['state'] in TERMINAL_STATES:
+                return job_run
+
+            # Return the last status when the timeout has elapsed
+            #   The last poll is made at the deadline, so the final sleep is shortened to
+            #   the remaining time
+            if deadline is None:
+                time.sleep(interval)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return job_run
+                time.sleep(min(interval, remaining))
+
+            interval = min(interval * 1.5, max_interval)
+
+
+# Define type-checking function(s)
+@functools.lru_cache(maxsize=None)
+def _get_field_validators(
+    dataclass_object: object
+) -> Tuple[Tuple[str, Type, bool], ...]:
+    """ Get the name, type and whether the field is a directory path of each field of the
+    dataclass as a `tuple`. The field metadata is resolved once per dataclass and cached for
+    subsequent instances.
+
+    Parameters
+    ----------
+    dataclass_object : `object`
+        The dataclass object.
+    """
+    return tuple(
+        (variable.name, variable.type, variable.name in _PATH_VARIABLES)
+        for variable in fields(dataclass_object)
+    )
+
+
+# Define state function(s)
+def _state(
+    name: str
+) -> str:
+    """ Returns the upper-case job-run state of a `prefect` state name. The result is
+    interned and cached per `name`, so repeated polls re-use the same `str`.
+
+    Parameters
+    ----------
+    name : `str`
+        The `prefect` state name, e.g., `Completed`.
+    """
+    try:
+        return _STATE_NAMES[name]
+    except KeyError:
+        return _STATE_NAMES.setdefault(name, sys.intern(str(name).upper()))
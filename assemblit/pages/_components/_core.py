@@ -8,6 +8,29 @@ from assemblit import setup
 from assemblit._auth import vault
 from assemblit.blocks.structures import Setting
 
+# Page styling, rendered once at import and re-used on every re-run
+_PAGE_STYLE_RULES = """
+    .main {
+        overflow-y: scroll;
+    }
+
+    div[data-testid="stAppViewBlockContainer"] {
+        padding: 3rem 1rem 10rem 1rem;
+    }
+
+    div[data-testid="stHorizontalBlock"] {
+        gap: 0.5rem;
+    }
+"""
+_PAGE_STYLE = '<style>%s</style>' % (_PAGE_STYLE_RULES)
+_PAGE_STYLE_HEADERLESS = '<style>%s</style>' % (
+    """
+    header[data-testid="stHeader"] {
+        display: none;
+    }
+    """ + _PAGE_STYLE_RULES
+)
+
 
 # Define generic initialization function(s)
 def initialize_session_state_defaults():
@@ -90,49 +113,9 @@ def set_page_config(
 
     # Force custom styling
     if not setup.DEBUG:
-        st.html(
-            """
-                <style>
-
-                    header[data-testid="stHeader"] {
-                        display: none;
-                    }
-
-                    .main {
-                        overflow-y: scroll;
-                    }
-
-                    div[data-testid="stAppViewBlockContainer"] {
-                        padding: 3rem 1rem 10rem 1rem;
-                    }
-
-                    div[data-testid="stHorizontalBlock"] {
-                        gap: 0.5rem;
-                    }
-
-                </style>
-            """
-        )
+        st.html(_PAGE_STYLE_HEADERLESS)
     else:
-        st.html(
-            """
-                <style>
-
-                    .main {
-                        overflow-y: scroll;
-                    }
-
-                    div[data-testid="stAppViewBlockContainer"] {
-                        padding: 3rem 1rem 10rem 1rem;
-                    }
-
-                    div[data-testid="stHorizontalBlock"] {
-                        gap: 0.5rem;
-                    }
-
-                </style>
-            """
-        )
+        st.html(_PAGE_STYLE)
 
     # Debug
     if setup.DEBUG:
@@ -148,10 +148,10 @@ def display_key_value_pair_settings_form(
 
         # Display the form header
         if header and tagline:
-            st.write('### %s' % header)
-            st.write('%s' % tagline)
-            st.write('')
-            st.write('')
+            st.markdown(
+                '### %s\n\n%s\n\n<div style="height: 2rem;"></div>' % (header, tagline),
+                unsafe_allow_html=True
+            )
 
         # Display table information as key-value pair configuration
         for setting in st.session_state[setup.NAME][db_name][table_name]['settings']:
@@ -2,6 +2,7 @@
 
 import os
 import inspect
+import functools
 from typing import Any, List, Union, Tuple
 import streamlit as st
 from assemblit import setup, _app
@@ -217,7 +218,7 @@ class Content():
             unsafe_allow_html=True
         )
 
-        if doc := inspect.getdoc(obj):
+        if doc := _get_doc(obj):
             col2.code(doc, language='markdown')
 
     def _display_method_documentation(self, methods: Any):
@@ -238,7 +239,7 @@ class Content():
                     unsafe_allow_html=True
                 )
 
-                if doc := inspect.getdoc(method):
+                if doc := _get_doc(method):
                     st.code(doc, language='markdown')
 
     def _display_function_documentation(self, functions: Any):
@@ -259,7 +260,7 @@ class Content():
                     unsafe_allow_html=True
                 )
 
-                if doc := inspect.getdoc(fn):
+                if doc := _get_doc(fn):
                     st.code(doc, language='markdown')
 
     def _display_exception_documentation(self, exceptions: Any):
@@ -280,7 +281,7 @@ class Content():
                     unsafe_allow_html=True
                 )
 
-                if doc := inspect.getdoc(exception):
+                if doc := _get_doc(exception):
                     st.code(doc, language='markdown')
 
     def _display_module_documentation(self, obj: Any, module_name: Union[str, None] = None):
@@ -332,6 +333,20 @@ class Content():
 
 
 # Define inspection function(s)
+@functools.lru_cache(maxsize=1024)
+def _get_doc(obj: Any) -> Union[str, None]:
+    """ Returns the cleaned docstring of `obj`. Docstrings do not change within a
+    process, so the result is cached across re-runs. The cache is bounded, since it
+    holds a reference to each documented object.
+
+    Parameters
+    ----------
+    obj : `Any`
+        Object to inspect.
+    """
+    return inspect.getdoc(obj)
+
+
 def _get_relative_path(full_path, base_path) -> str:
     return os.path.relpath(
         full_path,
@@ -403,7 +418,7 @@ def _parse_return_annotation(obj: Any) -> str:
 
 def _parse_object_title(obj: Any) -> str:
     try:
-        return [line for line in inspect.getdoc(obj).splitlines() if line][0]
+        return [line for line in _get_doc(obj).splitlines() if line][0]
     except (AttributeError, IndexError):
         return ''
 
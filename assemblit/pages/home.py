@@ -9,6 +9,32 @@ from assemblit._auth import vault
 from assemblit.pages._components import _core
 
 _COMPATIBLE_APP_TYPES = _app.__all__
+_AUTHENTICATION_PAGE_STYLE = """
+    <style>
+        [data-testid="collapsedControl"] {
+            display: none;
+        }
+    </style>
+"""
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_content(
+    file_path: Union[str, os.PathLike],
+    modified: Union[float, None]
+) -> str:
+    """ Reads and caches the contents of the markdown document `file_path`. The
+    cache is shared across re-runs and sessions and is invalidated when the
+    modification time of the document changes.
+
+    Parameters
+    ----------
+    file_path : `Union[str, os.PathLike]`
+        The relative or absolute path of the markdown document.
+    modified : `Union[float, None]`
+        The last modification time of the markdown document.
+    """
+    return toolkit.content.from_markdown(file_path=file_path)
 
 
 class Content():
@@ -114,6 +140,12 @@ class Content():
         """ Serves the home-page content.
         """
 
+        # Initialize session state defaults
+        #   Initialization is idempotent, so repeating it here keeps an instance that is
+        #   cached across reruns and sessions, e.g., via `st.cache_resource`, safe to serve
+        #   in a new session
+        _core.initialize_session_state_defaults()
+
         # Manage authentication
         if st.session_state[setup.NAME][setup.AUTH_NAME][setup.AUTH_QUERY_INDEX]:
 
@@ -138,16 +170,18 @@ class Content():
             if self.content_file_path:
 
                 # Display markdown content
-                readme = toolkit.content.from_markdown(file_path=self.content_file_path)
+                file_path = os.path.abspath(self.content_file_path)
+                readme = _load_content(
+                    file_path=file_path,
+                    modified=os.path.getmtime(file_path) if os.path.isfile(file_path) else None
+                )
 
                 if readme is not None:
                     col2.markdown(readme)
 
-            # Display content information
+            # Display content information within the same layout columns
             if self.content_info:
-                _core.display_page_content_info(
-                    content_info=self.content_info
-                )
+                col2.info(self.content_info, icon='ℹ️')
 
         else:
 
@@ -180,15 +214,7 @@ class Content():
             layout='centered',
             initial_sidebar_state='collapsed'
         )
-        st.html(
-            """
-                <style>
-                    [data-testid="collapsedControl"] {
-                        display: none;
-                    }
-                </style>
-            """
-        )
+        st.html(_AUTHENTICATION_PAGE_STYLE)
 
         # Display login content
         if not st.session_state[setup.NAME][setup.AUTH_NAME]['sign-up']:
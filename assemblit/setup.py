@@ -1,7 +1,7 @@
 """ Essential web-application settings """
 
 import os
-from typing import Union, List
+from typing import Union, Tuple
 import assemblit
 from assemblit._app import layer
 from assemblit.toolkit import _exceptions
@@ -10,9 +10,9 @@ from assemblit.toolkit import _exceptions
 # Layout settings
 LAYOUT: str = 'wide'
 INITIAL_SIDEBAR_STATE: str = 'expanded'
-HEADER_COLUMNS: List[Union[int, float]] = [.01, .99]
-CONTENT_COLUMNS: List[Union[int, float]] = [.02, .98]
-INDENTED_CONTENT_COLUMNS: List[Union[int, float]] = [.03, .97]
+HEADER_COLUMNS: Tuple[Union[int, float], ...] = (.01, .99)
+CONTENT_COLUMNS: Tuple[Union[int, float], ...] = (.02, .98)
+INDENTED_CONTENT_COLUMNS: Tuple[Union[int, float], ...] = (.03, .97)
 
 # Validate web-application type
 if 'ASSEMBLIT_APP_TYPE' not in os.environ:
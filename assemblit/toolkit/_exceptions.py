@@ -13,49 +13,40 @@ class InvalidAggregationRule(Exception):
 class MissingConfiguration(FileNotFoundError):
     """ Raises a missing configuration error."""
 
-    def __init__(self, *args, **kwargs):
-        default_message = ''.join([
-            "Missing configuration.",
-            " `assemblit` requires web-application configuration to be provided within '/.assemblit/config.yaml'.",
-            " See %s." % (assemblit._DOCS_URL)
-        ])
-
-        if not args:
-            args = (default_message,)
+    DEFAULT_MESSAGE: str = ''.join([
+        "Missing configuration.",
+        " `assemblit` requires web-application configuration to be provided within '/.assemblit/config.yaml'.",
+        " See %s." % (assemblit._DOCS_URL)
+    ])
 
-        super().__init__(*args, **kwargs)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*(args or (self.DEFAULT_MESSAGE,)), **kwargs)
 
 
 class InvalidConfiguration(KeyError):
     """ Raises an invalid configuration error."""
 
-    def __init__(self, *args, **kwargs):
-        default_message = ''.join([
-            "Invalid configuration.",
-            " `assemblit` requires environment variables to be provided within '/.assemblit/config.yaml'.",
-            " See %s." % (assemblit._DOCS_URL)
-        ])
-
-        if not args:
-            args = (default_message,)
+    DEFAULT_MESSAGE: str = ''.join([
+        "Invalid configuration.",
+        " `assemblit` requires environment variables to be provided within '/.assemblit/config.yaml'.",
+        " See %s." % (assemblit._DOCS_URL)
+    ])
 
-        super().__init__(*args, **kwargs)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*(args or (self.DEFAULT_MESSAGE,)), **kwargs)
 
 
 class MissingEnvironmentVariables(KeyError):
     """ Raises a missing environment variables error."""
 
-    def __init__(self, *args, **kwargs):
-        default_message = ''.join([
-            "Missing environment variables.",
-            " `assemblit` requires environment variables to be provided within '/.assemblit/config.yaml'.",
-            " See %s." % (assemblit._DOCS_URL)
-        ])
-
-        if not args:
-            args = (default_message,)
+    DEFAULT_MESSAGE: str = ''.join([
+        "Missing environment variables.",
+        " `assemblit` requires environment variables to be provided within '/.assemblit/config.yaml'.",
+        " See %s." % (assemblit._DOCS_URL)
+    ])
 
-        super().__init__(*args, **kwargs)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*(args or (self.DEFAULT_MESSAGE,)), **kwargs)
 
 
 class CompatibilityError(ValueError):
@@ -79,12 +70,14 @@ class CompatibilityError(ValueError):
         compatible_app_types : `List[str]`
             The list of compatible web-application types.
         """
-        default_message = ''.join([
-            "Incompatible app-type {%s} with {%s}." % (app_type, page_name),
-            " {%s} is only compatible with app-type(s) [%s]." % (page_name, ', '.join(compatible_app_types))
-        ])
-
         if not args:
-            args = (default_message,)
+            args = (
+                "Incompatible app-type {%s} with {%s}. {%s} is only compatible with app-type(s) [%s]." % (
+                    app_type,
+                    page_name,
+                    page_name,
+                    ', '.join(compatible_app_types)
+                ),
+            )
 
         super().__init__(*args, **kwargs)
@@ -0,0 +1,29 @@
+""" Type-checking utility """
+
+from typing import Type, Union, Any, get_origin, get_args
+
+
+def check_type(
+    expected_type: Type,
+    value: Any
+) -> bool:
+    """ Recursively check if a value matches the expected type. This function is
+    compatible with basic types, Union, and Optional.
+
+    Parameters
+    ----------
+    expected_type : `Type`
+        The expected type assigned to the dataclass field.
+    value : `Any`
+        The value to type check.
+    """
+
+    # Fast-path for non-generic types
+    if isinstance(expected_type, type):
+        return isinstance(value, expected_type)
+
+    # Handle Optional[Type] which is equivalent to Union[Type, None]
+    if get_origin(expected_type) is Union:
+        return any(check_type(expected_type=arg, value=value) for arg in get_args(expected_type))
+
+    return isinstance(value, expected_type)
@@ -1,7 +1,8 @@
 """ Configuration utility """
 
-from typing import Union, List
+from typing import Union, List, Tuple
 import os
+import functools
 import copy
 import yaml
 from pytensils import utils
@@ -177,6 +178,46 @@ def validate_type(
     supported_types : `List[str]`
         The list of support types.
     """
+    return _validate_type(env=env, type_=type_, supported_types=tuple(supported_types))
+
+
+def validate_port(
+    env: str,
+    port: str
+) -> str:
+    """ Validates a registered port address. Returns the port as a `str` if a valid
+    port is provided, otherwise raises an `assemblit.exceptions.InvalidConfiguration`
+    when the port is invalid or the port is not an integer as a string.
+
+    Parameters
+    ----------
+    env : `str`
+        The configuration environment.
+    port : `str`
+        The registered port address to validate.
+    """
+    return _validate_port(env=env, port=port)
+
+
+# Define cached validation functions
+@functools.lru_cache(maxsize=32)
+def _validate_type(
+    env: str,
+    type_: str,
+    supported_types: Tuple[str, ...]
+) -> str:
+    """ Validates the type and returns the type as a `str`. The result is cached for
+    each `env`, `type_` and `supported_types` combination.
+
+    Parameters
+    ----------
+    env : `str`
+        The configuration environment.
+    type_ : `str`
+        The type to validate
+    supported_types : `Tuple[str, ...]`
+        The tuple of support types.
+    """
 
     # Ensure that the web-application type is a valid supported type
     if type_.strip().lower() not in [i.strip().lower() for i in supported_types]:
@@ -192,13 +233,13 @@ def validate_type(
     return type_.strip().lower()
 
 
-def validate_port(
+@functools.lru_cache(maxsize=32)
+def _validate_port(
     env: str,
     port: str
 ) -> str:
-    """ Validates a registered port address. Returns the port as a `str` if a valid
-    port is provided, otherwise raises an `assemblit.exceptions.InvalidConfiguration`
-    when the port is invalid or the port is not an integer as a string.
+    """ Validates a registered port address and returns the port as a `str`. The result
+    is cached for each `env` and `port` combination.
 
     Parameters
     ----------
@@ -3,6 +3,7 @@
 import os
 import re
 import textwrap
+import functools
 from typing import Union
 
 
@@ -19,22 +20,7 @@ def clean_text(
         The text to clean.
     """
 
-    # Dedent
-    dedented = textwrap.dedent(str(text)).strip()
-
-    # If '\n' appears once not in any sequence (e.g. an isolated, single-return)
-    #   then replace '\n' with a single-space
-    replaced = re.sub(r'(?<!\n)\n(?!\n)', ' ', dedented)
-
-    # If '\n' appears in any sequence of multiple returns,
-    #   then reduce the sequence of returns by one
-    reduced = re.sub(r'\n{2,}', lambda m: '\n' * (len(m.group(0)) - 1), replaced)
-
-    # Remove whitespace
-    lines = [line.strip().replace('  ', ' ') for line in reduced.splitlines()]
-
-    # Preserve intentional newlines
-    return '\n'.join(lines)
+    return _clean_text(text=str(text))
 
 
 def from_markdown(
@@ -111,3 +97,34 @@ def _to_text_content(
     """
     with open(os.path.abspath(file_path), 'w', encoding='utf-8') as file:
         file.write(textwrap.dedent(content))
+
+
+@functools.lru_cache(maxsize=256)
+def _clean_text(
+    text: str
+) -> str:
+    """ Cleans `text`, see `clean_text()`. Page content is re-constructed on every
+    re-run from the same literal strings, so the cleaned text is cached.
+
+    Parameters
+    ----------
+    text : `str`
+        The text to clean.
+    """
+
+    # Dedent
+    dedented = textwrap.dedent(text).strip()
+
+    # If '\n' appears once not in any sequence (e.g. an isolated, single-return)
+    #   then replace '\n' with a single-space
+    replaced = re.sub(r'(?<!\n)\n(?!\n)', ' ', dedented)
+
+    # If '\n' appears in any sequence of multiple returns,
+    #   then reduce the sequence of returns by one
+    reduced = re.sub(r'\n{2,}', lambda m: '\n' * (len(m.group(0)) - 1), replaced)
+
+    # Remove whitespace
+    lines = [line.strip().replace('  ', ' ') for line in reduced.splitlines()]
+
+    # Preserve intentional newlines
+    return '\n'.join(lines)
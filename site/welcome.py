@@ -3,18 +3,23 @@
 Assemblit is helping data analysts and scientists rapidly scale notebooks into analytics-as-a-service (AaaS) web-applications.
 """
 
+import streamlit as st
 import assemblit.pages.home as home
 
+
 # Initialize the home-page content
-Welcome = home.Content(
-    header='Welcome',
-    tagline="""
-        Assemblit is helping data analysts and scientists rapidly scale notebooks into
-         analytics-as-a-service (AaaS) web-applications.
-    """,
-    content_file_path='./documentation/README.md',
-    content_info=None
-)
+@st.cache_resource(show_spinner=False)
+def _welcome() -> home.Content:
+    return home.Content(
+        header='Welcome',
+        tagline="""
+            Assemblit is helping data analysts and scientists rapidly scale notebooks into
+             analytics-as-a-service (AaaS) web-applications.
+        """,
+        content_file_path='./documentation/README.md',
+        content_info=None
+    )
+
 
 # Serve content
-Welcome.serve()
+_welcome().serve()
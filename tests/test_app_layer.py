@@ -5,7 +5,7 @@ import shutil
 import pytest
 from pytensils import utils
 from streamlit.testing.v1 import AppTest
-from assemblit.toolkit import _yaml, content
+from assemblit.toolkit import _yaml, _exceptions, content
 from assemblit._app import layer
 
 
@@ -55,6 +55,46 @@ def test_assemblit_build_demo_notimplementederror():
         )
 
 
+def test_assemblit_create_app_success():
+
+    # Load the web-application configuration
+    config = _yaml.load_configuration(path=os.path.abspath(PATH))
+
+    # Create the web-application environment from the configuration
+    demo = layer.create_app(config=config)
+
+    assert demo.ASSEMBLIT_NAME == 'demo'
+    assert demo.ASSEMBLIT_DIR == PATH
+
+
+def test_assemblit_create_app_preloaded_success():
+
+    # Load the web-application configuration
+    config = _yaml.load_configuration(path=os.path.abspath(PATH))
+
+    # Create the web-application environment from the already known type and environment
+    demo = layer.create_app(
+        config=config,
+        app_type=config['assemblit']['app']['type'],
+        environment=config['assemblit']['app']['env']
+    )
+
+    assert demo.to_dict() == layer.create_app(config=config).to_dict()
+
+
+def test_assemblit_create_app_invalidconfiguration():
+
+    # Load the web-application configuration
+    config = _yaml.load_configuration(path=os.path.abspath(PATH))
+
+    with pytest.raises(_exceptions.InvalidConfiguration):
+        layer.create_app(
+            config=config,
+            app_type='app-type-not-supported',
+            environment=config['assemblit']['app']['env']
+        )
+
+
 def test_assemblit_demo_app_run_success():
 
     # Load the web-application configuration
@@ -0,0 +1,71 @@
+""" Tests the `assemblit` and `orchestrator` command-line utilities """
+
+import sys
+import errno
+import pytest
+from assemblit._app.cli import assemblit
+from assemblit._orchestrator.cli import orchestrator
+
+
+def dispatch(cli, command: str, monkeypatch) -> list:
+    calls = []
+    monkeypatch.setitem(cli._COMMANDS, command, lambda **kwargs: calls.append(kwargs))
+    return calls
+
+
+def test_assemblit_cli_run_success(monkeypatch):
+    calls = dispatch(cli=assemblit, command='run', monkeypatch=monkeypatch)
+    monkeypatch.setattr(sys, 'argv', ['assemblit', 'run', 'app.py'])
+
+    assert assemblit.main() is None
+    assert calls == [{'script': 'app.py'}]
+
+
+def test_assemblit_cli_build_success(monkeypatch):
+    calls = dispatch(cli=assemblit, command='build', monkeypatch=monkeypatch)
+    monkeypatch.setattr(sys, 'argv', ['assemblit', 'build', 'demo'])
+
+    assert assemblit.main() is None
+    assert calls == [{'app_type': 'demo'}]
+
+
+def test_assemblit_cli_no_command_einval(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['assemblit'])
+
+    assert assemblit.main() == errno.EINVAL
+
+
+def test_assemblit_cli_invalid_app_type_systemexit(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['assemblit', 'build', 'app-type-not-implemented'])
+
+    with pytest.raises(SystemExit):
+        assemblit.main()
+
+
+def test_assemblit_cli_help_systemexit(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['assemblit', '--help'])
+
+    with pytest.raises(SystemExit):
+        assemblit.main()
+
+
+def test_assemblit_cli_build_parser_cache_success():
+    assert assemblit._build_parser() is assemblit._build_parser()
+
+
+def test_orchestrator_cli_start_success(monkeypatch):
+    calls = dispatch(cli=orchestrator, command='start', monkeypatch=monkeypatch)
+    monkeypatch.setattr(sys, 'argv', ['orchestrator', 'start', '.'])
+
+    assert orchestrator.main() is None
+    assert calls == [{'path': '.'}]
+
+
+def test_orchestrator_cli_no_command_einval(monkeypatch):
+    monkeypatch.setattr(sys, 'argv', ['orchestrator'])
+
+    assert orchestrator.main() == errno.EINVAL
+
+
+def test_orchestrator_cli_build_parser_cache_success():
+    assert orchestrator._build_parser() is orchestrator._build_parser()
@@ -0,0 +1,43 @@
+""" Tests the `assemblit._database` subpackage """
+
+import pandera
+from assemblit._database import _generic
+
+
+def test_lazyschema_success():
+    calls = []
+
+    class Schemas():
+
+        @_generic.LazySchema
+        def table() -> _generic.Schema:
+            """ The `table` table Schema """
+            calls.append('table')
+            return _generic.Schema(
+                name='table',
+                columns={
+                    'id': pandera.Column(str, nullable=False, unique=True, metadata={'primary_key': True})
+                }
+            )
+
+    # The schema is not constructed until it is accessed
+    assert calls == []
+
+    # Class and instance access return the same cached schema
+    assert isinstance(Schemas.table, _generic.Schema)
+    assert Schemas.table.name == 'table'
+    assert Schemas.table is Schemas.table
+    assert Schemas().table is Schemas.table
+    assert calls == ['table']
+
+
+def test_lazyschema_doc_success():
+
+    class Schemas():
+
+        @_generic.LazySchema
+        def table() -> _generic.Schema:
+            """ The `table` table Schema """
+            return _generic.Schema(name='table')
+
+    assert Schemas.__dict__['table'].__doc__ == ' The `table` table Schema '
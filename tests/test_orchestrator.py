@@ -0,0 +1,275 @@
+""" Tests the `assemblit._orchestrator` subpackage """
+
+import threading
+import pytest
+import requests
+from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from assemblit._orchestrator import prefect
+
+
+class FakeResponse():
+    """ A `requests.Response` that returns a fixed payload. """
+
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.ok = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def json(self) -> dict:
+        return self.payload
+
+
+class FakeSession():
+    """ A `requests.Session` that forwards requests to a `FakeServer`. """
+
+    def __init__(self, server: 'FakeServer'):
+        self.server = server
+
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        return self.server.handle(method='GET', url=url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> FakeResponse:
+        return self.server.handle(method='POST', url=url, **kwargs)
+
+
+class FakeServer():
+    """ Serves the `prefect` REST API routes requested by `prefect.env`. """
+
+    def __init__(self):
+        self.available = True
+        self.deployment_id = 'deployment-id'
+        self.token = 'token'
+        self.requests = []
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    def session(self) -> FakeSession:
+        with self.lock:
+            self.sessions.append(threading.get_ident())
+        return FakeSession(server=self)
+
+    def count(self, route: str) -> int:
+        with self.lock:
+            return sum(1 for _, url in self.requests if route in url)
+
+    def handle(self, method: str, url: str, **kwargs) -> FakeResponse:
+        if not self.available:
+            raise requests.exceptions.ConnectionError
+
+        with self.lock:
+            self.requests.append((method, url))
+
+        if url.endswith('/health'):
+            return FakeResponse(payload=True)
+        if url.endswith('/csrf-token'):
+            return FakeResponse(payload={'token': self.token})
+        if '/deployments/name/' in url:
+            return FakeResponse(payload={'id': self.deployment_id})
+        if url.endswith('/create_flow_run'):
+            if (
+                url.split('/')[-2] != self.deployment_id
+                or kwargs['headers']['prefect-csrf-token'] != self.token
+            ):
+                return FakeResponse(payload={'detail': 'Not found'})
+            return FakeResponse(
+                payload=flow_run(run_id=kwargs['json']['name'], parameters=kwargs['json']['parameters'])
+            )
+        return FakeResponse(payload=flow_run(run_id=url.split('/')[-1]))
+
+
+def flow_run(run_id: str, parameters: Union[dict, None] = None) -> dict:
+    return {
+        'id': run_id,
+        'state': {'name': 'Completed'},
+        'start_time': '2024-01-01T00:00:00',
+        'end_time': '2024-01-01T00:00:01',
+        'total_run_time': 1.0,
+        'parameters': parameters or {},
+        'tags': ['assemblit']
+    }
+
+
+@pytest.fixture
+def SERVER() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture
+def ENV(SERVER: FakeServer, tmp_path, monkeypatch) -> prefect.env:
+    env = prefect.env(
+        ASSEMBLIT_SERVER_JOB_NAME='job',
+        ASSEMBLIT_SERVER_JOB_ENTRYPOINT=str(tmp_path / 'workflow.py'),
+        ASSEMBLIT_SERVER_DEPLOYMENT_NAME='deployment',
+        ASSEMBLIT_SERVER_DIR=str(tmp_path / 'server')
+    )
+    monkeypatch.setattr(env, '_create_session', SERVER.session)
+    return env
+
+
+def run_and_poll(env: prefect.env, index: int) -> tuple:
+    job_run = env.run_job(name='run-%s' % index, job_name='job', deployment_name='deployment', index=index)
+    return job_run, env.poll_job_run(run_id=job_run['id'])
+
+
+def test_prefect_env_concurrent_run_job_and_poll_job_run_success(SERVER: FakeServer, ENV: prefect.env):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda index: run_and_poll(env=ENV, index=index), range(64)))
+
+    for index, (job_run, polled_job_run) in enumerate(results):
+        assert job_run['id'] == 'run-%s' % index
+        assert job_run['parameters'] == {'index': index}
+        assert polled_job_run['state'] == 'COMPLETED'
+
+    # All threads share one session
+    assert len(SERVER.sessions) == 1
+    assert ENV._deployment_ids == {('job', 'deployment'): 'deployment-id'}
+    assert ENV._token == 'token'
+
+
+def test_prefect_env_concurrent_run_job_stale_deployment_id_success(SERVER: FakeServer, ENV: prefect.env):
+    run_and_poll(env=ENV, index=0)
+
+    # Re-deploy the `flow`, so that all threads start with a stale deployment id
+    SERVER.deployment_id = 'redeployed-id'
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda index: run_and_poll(env=ENV, index=index), range(1, 65)))
+
+    assert all(job_run['id'] == 'run-%s' % index for index, (job_run, _) in enumerate(results, start=1))
+    assert ENV._deployment_ids == {('job', 'deployment'): 'redeployed-id'}
+
+
+def test_prefect_env_new_thread_per_call_session_success(SERVER: FakeServer, ENV: prefect.env):
+    results = {}
+
+    # Handle every call on a new thread, like the script thread of each Streamlit re-run
+    for index in range(32):
+        thread = threading.Thread(target=lambda index=index: results.update({index: run_and_poll(env=ENV, index=index)}))
+        thread.start()
+        thread.join()
+
+    assert all(results[index][0]['id'] == 'run-%s' % index for index in range(32))
+
+    # The session is created once and re-used by all threads
+    assert len(SERVER.sessions) == 1
+    assert ENV._session is ENV._session
+
+
+def test_prefect_env_get_deployment_id_cache_success(SERVER: FakeServer, ENV: prefect.env):
+    run_and_poll(env=ENV, index=0)
+    run_and_poll(env=ENV, index=1)
+
+    assert SERVER.count(route='/deployments/name/') == 1
+    assert SERVER.count(route='/csrf-token') == 1
+    assert SERVER.count(route='/create_flow_run') == 2
+
+
+def test_prefect_env_get_token_expired_success(SERVER: FakeServer, ENV: prefect.env, monkeypatch):
+    monkeypatch.setattr(prefect, 'TOKEN_TTL', -1)
+
+    assert ENV.get_token() == 'token'
+    SERVER.token = 'refreshed-token'
+    assert ENV.get_token() == 'refreshed-token'
+    assert SERVER.count(route='/csrf-token') == 2
+
+
+def test_prefect_env_run_job_stale_deployment_id_success(SERVER: FakeServer, ENV: prefect.env):
+    run_and_poll(env=ENV, index=0)
+    SERVER.deployment_id = 'redeployed-id'
+    SERVER.token = 'refreshed-token'
+
+    job_run, _ = run_and_poll(env=ENV, index=1)
+
+    assert job_run['id'] == 'run-1'
+    assert SERVER.count(route='/deployments/name/') == 2
+    assert SERVER.count(route='/csrf-token') == 2
+    assert SERVER.count(route='/create_flow_run') == 3
+    assert ENV._deployment_ids == {('job', 'deployment'): 'redeployed-id'}
+    assert ENV._token == 'refreshed-token'
+
+
+def test_prefect_env_run_job_missing_deployment_id_none(SERVER: FakeServer, ENV: prefect.env, monkeypatch):
+    monkeypatch.setattr(ENV, 'get_deployment_id', lambda job_name, deployment_name: None)
+
+    assert ENV.run_job(name='run-0', job_name='job', deployment_name='deployment') is None
+    assert SERVER.count(route='/create_flow_run') == 0
+
+
+def test_prefect_env_unavailable_server_none(SERVER: FakeServer, ENV: prefect.env):
+    SERVER.available = False
+
+    assert not ENV.health_check()
+    assert ENV.get_token() is None
+    assert ENV.get_deployment_id(job_name='job', deployment_name='deployment') is None
+    assert ENV.run_job(name='run-0', job_name='job', deployment_name='deployment') is None
+    assert ENV.poll_job_run(run_id='run-0') is None
+    assert ENV._deployment_ids == {}
+    assert ENV._token is None
+
+
+@pytest.fixture
+def SLEEPS(monkeypatch) -> list:
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds: float):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(prefect.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(prefect.time, 'sleep', sleep)
+    return sleeps
+
+
+def poll_states(env: prefect.env, states: list, monkeypatch) -> list:
+    polls = []
+
+    def poll_job_run(run_id: str) -> Union[dict, None]:
+        state = states[min(len(polls), len(states) - 1)]
+        polls.append(run_id)
+        return None if state is None else {'state': state}
+
+    monkeypatch.setattr(env, 'poll_job_run', poll_job_run)
+    return polls
+
+
+def test_prefect_env_wait_until_terminal_backoff_success(ENV: prefect.env, SLEEPS: list, monkeypatch):
+    polls = poll_states(
+        env=ENV,
+        states=['PENDING', 'RUNNING', 'RUNNING', 'RUNNING', 'RUNNING', 'COMPLETED'],
+        monkeypatch=monkeypatch
+    )
+
+    assert ENV.wait_until_terminal(run_id='run-0', max_interval=0.5) == {'state': 'COMPLETED'}
+    assert SLEEPS == pytest.approx([0.2, 0.3, 0.45, 0.5, 0.5])
+    assert len(polls) == 6
+
+
+def test_prefect_env_wait_until_terminal_terminal_success(ENV: prefect.env, SLEEPS: list, monkeypatch):
+    polls = poll_states(env=ENV, states=['FAILED'], monkeypatch=monkeypatch)
+
+    assert ENV.wait_until_terminal(run_id='run-0') == {'state': 'FAILED'}
+    assert SLEEPS == []
+    assert len(polls) == 1
+
+
+def test_prefect_env_wait_until_terminal_unavailable_server_none(ENV: prefect.env, SLEEPS: list, monkeypatch):
+    polls = poll_states(env=ENV, states=['RUNNING', None], monkeypatch=monkeypatch)
+
+    assert ENV.wait_until_terminal(run_id='run-0') is None
+    assert SLEEPS == pytest.approx([0.2])
+    assert len(polls) == 2
+
+
+def test_prefect_env_wait_until_terminal_timeout_success(ENV: prefect.env, SLEEPS: list, monkeypatch):
+    polls = poll_states(env=ENV, states=['RUNNING'], monkeypatch=monkeypatch)
+
+    assert ENV.wait_until_terminal(run_id='run-0', timeout=1.0) == {'state': 'RUNNING'}
+    assert SLEEPS == pytest.approx([0.2, 0.3, 0.45, 0.05])
+    assert len(polls) == 5
@@ -5,7 +5,9 @@ import pytest
 import textwrap
 import pandas as pd
 import plotly.graph_objects
+from typing import Union, Optional
 from assemblit import toolkit
+from assemblit.toolkit import _types
 from assemblit.toolkit._exceptions import InvalidAggregationRule
 
 
@@ -163,3 +165,15 @@ def test_clean_text_success():
         analytics-as-a-service (AaaS) web-applications.
     """
     assert toolkit.content.clean_text(text=text) == 'Assemblit is helping data analysts and scientists rapidly scale notebooks into analytics-as-a-service (AaaS) web-applications.'
+
+
+def test_types_check_type_success():
+    assert _types.check_type(expected_type=str, value='assemblit')
+    assert _types.check_type(expected_type=Union[str, int], value=1)
+    assert _types.check_type(expected_type=Optional[int], value=None)
+
+
+def test_types_check_type_mismatch():
+    assert not _types.check_type(expected_type=str, value=1)
+    assert not _types.check_type(expected_type=Union[str, int], value=1.0)
+    assert not _types.check_type(expected_type=Optional[int], value='1')